@@ -1,20 +1,23 @@
-import json
+from news_content import exit_if_applied, read_news, save_news
 
 # Load current news.json
-with open('content/news.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+data = read_news()
 
 # Get existing content
 existing_content = data[0]['modalContent']['content']
 
+# Stop if the banner is already there (its alt text outlives restyling)
+exit_if_applied(existing_content, "alt='Interview with GM Erik'", 'add_interview_banner')
+
 # Add banner image at the beginning
 banner_html = "<div style='text-align: center; margin-bottom: 2rem;'><img src='assets/interview_erik/interview_banner.png' alt='Interview with GM Erik' style='max-width: 100%; border-radius: 8px;'/></div>\n\n"
 
 # Update the interview content with banner at the beginning
-data[0]['modalContent']['content'] = banner_html + existing_content
+content = banner_html + existing_content
+
+data[0]['modalContent']['content'] = content
 
-# Save back to file
-with open('content/news.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=4)
+# Save via a temp file so an interrupted run can't truncate news.json
+save_news(data)
 
 print("✓ Dodano banner na górze wywiadu!")
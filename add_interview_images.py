@@ -1,13 +1,36 @@
-import json
-import base64
+import hashlib
+import orjson
+import mmap
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
+
+from news_content import exit_if_applied, read_news, save_news
+
+# pybase64 uses SIMD kernels and is a drop-in replacement for the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Leading bytes of each supported image format, used to pick the data URI MIME
+# type from the file contents rather than its extension (.jpg is image/jpeg)
+IMAGE_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": "image/png",
+    b"\xff\xd8\xff": "image/jpeg",
+    b"GIF8": "image/gif",
+    b"RIFF": "image/webp",
+}
 
 # Load current news.json
-with open('content/news.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+data = read_news()
 
 content = data[0]['modalContent']['content']
 
+# Stop if the images are already in (checked via the first image's caption)
+exit_if_applied(content, "Eric, the creator of Project Fibula</p>", 'add_interview_images')
+
 # Load images and convert to base64
 images = {
     'eric_stream': Path("assets/interview_erik/eric_stream.png"),
@@ -15,24 +38,56 @@ images = {
     'gmerik': Path("assets/interview_erik/gmerik.png")
 }
 
-image_data = {}
-for key, path in images.items():
-    if path.exists():
-        with open(path, "rb") as f:
-            ext = path.suffix[1:]  # jpg or png
-            image_data[key] = f"data:image/{ext};base64,{base64.b64encode(f.read()).decode()}"
-    else:
+# Data URIs from earlier runs, keyed by the SHA-256 of the image bytes, so
+# unchanged images are not base64-encoded again
+B64_CACHE_PATH = Path('.cache/img_b64.json')
+b64_cache = orjson.loads(B64_CACHE_PATH.read_bytes()) if B64_CACHE_PATH.exists() else {}
+
+def encode_image(path):
+    """Return the data URI for an image file, or None if it can't be used."""
+    if not path.exists():
         print(f"Warning: {path} not found")
+        return None
+    # Map the file instead of reading it so the raw bytes are never copied
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        digest = hashlib.sha256(mm).hexdigest()
+        if digest in b64_cache:
+            return b64_cache[digest]
+        head = mm[:8]
+        mime = next((m for sig, m in IMAGE_SIGNATURES.items() if head.startswith(sig)), None)
+        if mime is None:
+            print(f"Warning: {path} is not a recognised image format")
+            return None
+        b64_cache[digest] = f"data:{mime};base64,{base64.b64encode(mm).decode()}"
+        return b64_cache[digest]
+
+# The images are independent and SHA-256 hashing of large buffers releases the
+# GIL, so file reads and hashing overlap when they are encoded concurrently
+with ThreadPoolExecutor(max_workers=len(images)) as executor:
+    image_data = dict(zip(images, executor.map(encode_image, images.values())))
+
+B64_CACHE_PATH.parent.mkdir(exist_ok=True)
+B64_CACHE_PATH.write_bytes(orjson.dumps(b64_cache))
+
+# Every insertion below needs its image, so stop before editing anything
+missing = [str(images[key]) for key, uri in image_data.items() if uri is None]
+if missing:
+    sys.exit(f"Error: can't embed the interview images, unusable file(s): {', '.join(missing)}")
 
 # Image template with golden border
-def make_image(src, alt, caption=""):
-    caption_html = f"<p style='text-align: center; color: #d4af37; font-style: italic; margin-top: 0.5rem; font-size: 0.9rem;'>{caption}</p>" if caption else ""
-    return f"""
+IMAGE_TEMPLATE = Template("""
 <div style='text-align: center; margin: 2rem 0;'>
-    <img src='{src}' alt='{alt}' style='max-width: 60%; border: 3px solid #d4af37; border-radius: 8px; box-shadow: 0 4px 8px rgba(212, 175, 55, 0.3);'/>
-    {caption_html}
+    <img src='$src' alt='$alt' style='max-width: 60%; border: 3px solid #d4af37; border-radius: 8px; box-shadow: 0 4px 8px rgba(212, 175, 55, 0.3);'/>
+    $caption_html
 </div>
-"""
+""")
+CAPTION_TEMPLATE = Template(
+    "<p style='text-align: center; color: #d4af37; font-style: italic; margin-top: 0.5rem; font-size: 0.9rem;'>$caption</p>"
+)
+
+def make_image(src, alt, caption=""):
+    caption_html = CAPTION_TEMPLATE.substitute(caption=caption) if caption else ""
+    return IMAGE_TEMPLATE.substitute(src=src, alt=alt, caption_html=caption_html)
 
 # 1. eric_stream.png - after the first answer about who he is
 content = content.replace(
@@ -58,9 +113,8 @@ content = content.replace(
 # Update content
 data[0]['modalContent']['content'] = content
 
-# Save back
-with open('content/news.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=4)
+# Save via a temp file so an interrupted run can't truncate news.json
+save_news(data)
 
 print("✓ Dodano 3 obrazki do wywiadu ze złotymi ramkami!")
 print("  - Zdjęcie Erica (po pierwszej odpowiedzi)")
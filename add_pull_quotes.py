@@ -1,12 +1,16 @@
-import json
 import re
+from string import Template
+
+from news_content import exit_if_applied, read_news, save_news
 
 # Load current news.json
-with open('content/news.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+data = read_news()
 
 content = data[0]['modalContent']['content']
 
+# Stop if the pull quotes are already in the interview
+exit_if_applied(content, "<blockquote class='pull-quote'", 'add_pull_quotes')
+
 # Define pull quotes with their locations (after which text to insert them)
 pull_quotes = [
     {
@@ -61,33 +65,49 @@ pull_quotes = [
 ]
 
 # Pull quote HTML template
-def make_pull_quote(text):
-    return f"\n<blockquote class='pull-quote' style='font-size: 1.3rem; font-style: italic; color: #d4af37; border-left: 4px solid #d4af37; padding-left: 1.5rem; margin: 2rem 0;'>{text}</blockquote>\n"
+PULL_QUOTE_TEMPLATE = Template(
+    "\n<blockquote class='pull-quote' style='font-size: 1.3rem; font-style: italic; color: #d4af37; border-left: 4px solid #d4af37; padding-left: 1.5rem; margin: 2rem 0;'>$text</blockquote>\n"
+)
 
-# Insert pull quotes
-for pq in pull_quotes:
-    if pq.get('skip'):
-        continue
-    
-    if pq['after'] in content:
-        pull_quote_html = make_pull_quote(pq['quote'])
-        content = content.replace(pq['after'], pq['after'] + pull_quote_html)
-    else:
-        print(f"Warning: Could not find location for quote: {pq['quote'][:50]}...")
+def make_pull_quote(text):
+    return PULL_QUOTE_TEMPLATE.substitute(text=text)
 
-# Add the last quote manually at the end before final message
+# The last quote goes manually before the final question
+final_question = "<h4>Q: If you want, you can write a few words directly to the players at the end here.</h4>"
 final_quote = make_pull_quote('"We are not going to forget Project Fibula."')
-# Insert before the final question
-content = content.replace(
-    "<h4>Q: If you want, you can write a few words directly to the players at the end here.</h4>",
-    final_quote + "<h4>Q: If you want, you can write a few words directly to the players at the end here.</h4>"
+
+# Insert all pull quotes in a single pass: split the content on every anchor
+# (the capturing group keeps anchors as tokens) and join the pieces once,
+# instead of rebuilding the whole string with one content.replace() per quote
+active_quotes = {pq['after']: pq for pq in pull_quotes if not pq.get('skip')}
+anchor_pattern = re.compile(
+    "(" + "|".join(re.escape(anchor) for anchor in [*active_quotes, final_question]) + ")"
 )
+found_anchors = set()
+parts = []
+
+for i, token in enumerate(anchor_pattern.split(content)):
+    # Odd tokens are the matched anchors, even tokens the text between them
+    if i % 2 == 0:
+        parts.append(token)
+    elif token == final_question:
+        parts.append(final_quote)
+        parts.append(token)
+    else:
+        found_anchors.add(token)
+        parts.append(token)
+        parts.append(make_pull_quote(active_quotes[token]['quote']))
+
+content = "".join(parts)
+
+for anchor, pq in active_quotes.items():
+    if anchor not in found_anchors:
+        print(f"Warning: Could not find location for quote: {pq['quote'][:50]}...")
 
 # Update the content
 data[0]['modalContent']['content'] = content
 
-# Save back to file
-with open('content/news.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=4)
+# Save via a temp file so an interrupted run can't truncate news.json
+save_news(data)
 
 print("✓ Dodano wszystkie 12 pull quotes do wywiadu!")
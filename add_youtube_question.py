@@ -1,12 +1,23 @@
-import json
 import re
 
+from news_content import exit_if_applied, read_news, save_news
+
+# Answer block following the "Do you play a character yourself" question. The
+# tempered token takes one character per step and only checks for
+# '</blockquote>' at a '<', so the match stops at the first closing tag without
+# the retry-per-character expansion of a lazy DOTALL '.*?'.
+QUESTION_PATTERN = re.compile(
+    r'<h4>Q: Do you play a character yourself(?:[^<]|<(?!/blockquote>))*</blockquote>\s*'
+)
+
 # Load current interview content
-with open('content/news.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+data = read_news()
 
 content = data[0]['modalContent']['content']
 
+# Stop if the question is already in the interview
+exit_if_applied(content, "<h4>Q: How has the popularity of your YouTube presence", 'add_youtube_question')
+
 # New question and answer
 new_qa = """<h4>Q: How has the popularity of your YouTube presence helped—and how has it challenged—the launch of the project?</h4>
 <blockquote>Having a background on YouTube certainly helped bring the initial players to the project; without it, nobody outside of my close friends would have logged in. However, you are absolutely right that it has also introduced its own challenges. I was not only the initial promoter—the friendly guy encouraging people to relive the nostalgia—but I am now also the administrator. I am responsible for every server issue, every ban, every cheater operating on the fringes, every message sent on Discord—the list goes on. This has led to many difficult moments and has damaged several good relationships I had before launching the server.</blockquote>
@@ -14,8 +25,7 @@ new_qa = """<h4>Q: How has the popularity of your YouTube presence helped—and
 """
 
 # Find the position after the "Do you play a character yourself" question
-pattern = r'(<h4>Q: Do you play a character yourself.*?</blockquote>\s*)'
-match = re.search(pattern, content, re.DOTALL)
+match = QUESTION_PATTERN.search(content)
 
 if match:
     # Insert new Q&A after the match
@@ -25,9 +35,8 @@ if match:
     # Update the JSON
     data[0]['modalContent']['content'] = new_content
     
-    # Save back to file
-    with open('content/news.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    # Save via a temp file so an interrupted run can't truncate news.json
+    save_news(data)
     
     print("✓ Successfully added YouTube question to the interview!")
     print(f"  Inserted at position {insert_pos}")
@@ -11,13 +11,17 @@ To run the application:
 """
 
 import streamlit as st
-import json
-from pathlib import Path
-from datetime import datetime
+import heapq
+import html
+import orjson
+from operator import itemgetter
+import threading
+import time
+from types import MappingProxyType
 import uuid
 import streamlit_analytics2 as streamlit_analytics
 
-from src.config import APP_TITLE, APP_SUBTITLE, APP_ICON
+from src.config import APP_TITLE, APP_SUBTITLE, APP_ICON, LOGO_PATH, LOGO_URL, NEWS_FILE, STATIC_DIR, STATIC_URL
 from src.ui.layout import (
     setup_page_config,
     load_custom_css,
@@ -25,18 +29,380 @@ from src.ui.layout import (
     create_footer
 )
 from src.logging_utils import setup_logger
-from src.services.fibula_status import fetch_online_count
 from src.analytics_utils import track_page_view
-import base64
 
 # Initialize logger
 logger = setup_logger(__name__)
 
+# Static markup for the home page (styles live in assets/styles.css)
+LOGO_HTML = """
+<div class="main-logo-container">
+    <img class="logo" src="{logo_url}" alt="Fibulopedia" decoding="async">{rotworm_html}
+</div>
+<div class="main-subtitle">
+    Your ultimate community hub and knowledge base for Fibula Project
+</div>
+"""
+
+# Logo and GIF are served as static files so the browser can cache them.
+# Both variants of the logo block (with and without the GIF) are built here.
+ROTWORM_PATH = STATIC_DIR / "rotworm.gif"
+ROTWORM_HTML = (
+    f"<img class='rotworm-gif' src='{STATIC_URL}/rotworm.gif' alt='Rotworm' "
+    "loading='lazy' decoding='async' fetchpriority='low'>"
+)
+LOGO_BLOCK_HTML = {
+    True: LOGO_HTML.format(logo_url=LOGO_URL, rotworm_html=ROTWORM_HTML),
+    False: LOGO_HTML.format(logo_url=LOGO_URL, rotworm_html=""),
+}
+
+GROZZE_PATH = STATIC_DIR / "grozze.png"
+
+WELCOME_BOX_HTML = """
+<div class="welcome-box">{avatar_html}
+    <h1>Welcome to Fibulopedia</h1>
+    <p>Your comprehensive guide to the Fibula Project - a faithful recreation of the classic Tibia 7.1 experience.</p>
+    <p>Explore weapons, equipment, spells, monsters, quests, and more.</p>
+    <p>Molot (Grozze in-game)</p>
+</div>
+"""
+
+QUICK_LINKS_HTML = """
+<div style="
+    background: rgba(40,40,40,0.4);
+    border: 2px solid #d4af37;
+    border-radius: 8px;
+    padding: 1.5rem;
+    text-align: center;
+">
+    <p style="margin: 0.5rem 0;">
+        <a href="https://amera.fibula.app/" target="_blank" style="color: #d4af37; text-decoration: none; font-size: 1.1rem; font-weight: bold;">
+            🌐 Project Fibula Official Website
+        </a>
+    </p>
+    <p style="margin: 0.5rem 0;">
+        <a href="https://discord.gg/Jzz6yUme" target="_blank" style="color: #7289da; text-decoration: none; font-size: 1.1rem; font-weight: bold;">
+            💬 Project Fibula Discord
+        </a>
+    </p>
+</div>
+"""
+
+
+# Category badge colors for news cards (read-only; shared across reruns)
+CATEGORY_COLORS = MappingProxyType({
+    "announcement": "#4a90e2",
+    "update": "#50c878",
+    "info": "#ffd700",
+    "event": "#ff6347",
+    "interview": "#9b59b6"
+})
+DEFAULT_BADGE_COLOR = "#ffd700"
+
+# News thumbnails by news id (paths relative to STATIC_DIR)
+NEWS_THUMBNAILS = {
+    5: "interview_erik/interview_banner_small.png",
+    4: "news_thumbnail/training_calculator.png",
+    3: "news_thumbnail/december_update_2.png",
+    2: "news_thumbnail/december_update_1.png",
+    1: "logo_transparent.png"
+}
+
+# News card templates, filled per item with str.format_map
+NEWS_CARD_HTML = """
+<div class="news-card">
+    <div class="news-card-header">
+        <span class="news-badge" style="background: {badge_color};">{category}</span>
+        <span class="news-date">{date}</span>
+    </div>
+    <h3>{title}</h3>
+    <p>{content}</p>
+    <div class="news-author">— {author}</div>
+</div>
+"""
+
+NEWS_CARD_THUMBNAIL_HTML = """
+<div class="news-card">
+    <div class="news-card-header">
+        <span class="news-badge" style="background: {badge_color};">{category}</span>
+        <span class="news-date">{date}</span>
+    </div>
+    <div class="news-card-body">
+        <div class="news-card-text">
+            <h3>{title}</h3>
+            <p>{content}</p>
+            <div class="news-author">— {author}</div>
+        </div>
+        <div class="news-thumbnail">
+            <img src="{thumbnail_url}" loading="lazy" decoding="async" alt="News Thumbnail">
+        </div>
+    </div>
+</div>
+"""
+
+# Interview modal wrappers
+INTERVIEW_SUBTITLE_HTML = """
+<div style="
+    color: #d4af37;
+    font-size: 1.2rem;
+    font-style: italic;
+    margin-bottom: 2rem;
+    border-left: 3px solid #d4af37;
+    padding-left: 1rem;
+">
+    {subtitle}
+</div>
+"""
+
+INTERVIEW_CONTENT_HTML = """
+<div class="interview-content" style="
+    color: #ccc;
+    font-size: 1rem;
+    line-height: 1.8;
+">
+    {content}
+</div>
+"""
+
+ONLINE_COUNT_REFRESH_SECONDS = 60
+
+
+def refresh_online_count(state: dict) -> None:
+    """
+    Keep the shared online player count up to date.
+    
+    Runs forever in a daemon thread, fetching the count every
+    ONLINE_COUNT_REFRESH_SECONDS so page reruns never wait on the network.
+    
+    Args:
+        state: Shared state dict updated in place.
+    """
+    # Imported here so requests/BeautifulSoup are only loaded when the
+    # (currently disabled) online counter is actually used
+    from src.services.fibula_status import fetch_online_count
+    while True:
+        state["count"] = fetch_online_count()
+        state["updated_at"] = time.time()
+        time.sleep(ONLINE_COUNT_REFRESH_SECONDS)
+
+
+@st.cache_resource
+def get_available_assets() -> dict:
+    """
+    Check which optional home-page assets are present.
+    
+    Cached as a resource: the static files ship with the deployment, so
+    they are checked once per process instead of stat-ed on every rerun.
+    
+    Returns:
+        Dict mapping each asset path to whether the file exists.
+    """
+    return {path: path.exists() for path in (LOGO_PATH, ROTWORM_PATH, GROZZE_PATH)}
+
+
+@st.cache_resource
+def get_online_count_state() -> dict:
+    """
+    Create the shared online count state and start its refresh thread.
+    
+    Cached as a resource, so one state dict and one background thread are
+    shared by all sessions.
+    
+    Returns:
+        Dict with the latest "count" (None until the first fetch finishes)
+        and the "updated_at" timestamp of that fetch.
+    """
+    state = {"count": None, "updated_at": 0.0}
+    threading.Thread(target=refresh_online_count, args=(state,), daemon=True).start()
+    return state
+
 
-@st.cache_data(ttl=60)
 def get_cached_online_count():
-    """Fetch online player count with 60-second cache."""
-    return fetch_online_count()
+    """Get the last fetched online player count without blocking."""
+    return get_online_count_state()["count"]
+
+
+@st.cache_data(show_spinner=False)
+def load_latest_news(mtime: float, limit: int = 5) -> list[dict]:
+    """
+    Load the newest news items from news.json.
+    
+    The result is cached until the file changes: callers pass the file's
+    modification time, so an edit to news.json produces a new cache key.
+    
+    Args:
+        mtime: Modification time of news.json (cache key only).
+        limit: Maximum number of items to return.
+    
+    Returns:
+        News items sorted by date, newest first.
+    """
+    news_items = orjson.loads(NEWS_FILE.read_bytes())
+    # Dates are stored as ISO-8601 strings (YYYY-MM-DD), so plain string
+    # comparison orders them chronologically without parsing. nlargest keeps
+    # only `limit` items on a heap instead of sorting the whole archive.
+    return heapq.nlargest(limit, news_items, key=itemgetter("date"))
+
+
+def render_news_card(news: dict) -> str:
+    """
+    Render the HTML card for a single news item.
+    
+    Args:
+        news: News item as loaded from news.json.
+    
+    Returns:
+        Card HTML, stripped so it starts its own HTML block when joined.
+    """
+    category = news.get("category", "info")
+    # Plain-text fields are escaped; "content" is authored HTML/markdown
+    news_view = {
+        **news,
+        "badge_color": CATEGORY_COLORS.get(category, DEFAULT_BADGE_COLOR),
+        "category": html.escape(category),
+        "date": html.escape(news["date"]),
+        "title": html.escape(news["title"]),
+        "author": html.escape(news.get("author", "Admin")),
+    }
+    
+    # Check if this news has a thumbnail
+    news_id = news.get('id')
+    if news_id in NEWS_THUMBNAILS:
+        news_view["thumbnail_url"] = f"{STATIC_URL}/{NEWS_THUMBNAILS[news_id]}"
+        return NEWS_CARD_THUMBNAIL_HTML.format_map(news_view).strip()
+    return NEWS_CARD_HTML.format_map(news_view).strip()
+
+
+@st.cache_data(show_spinner=False)
+def render_news_cards(news_mtime: float) -> list[str]:
+    """
+    Render the HTML cards for the latest news items.
+    
+    The rendered cards are cached until news.json changes, so a rerun
+    only has to stat the file. Thumbnails are referenced by their static
+    URL and fetched (and cached) by the browser.
+    
+    Args:
+        news_mtime: Modification time of news.json (cache key and
+            load_latest_news argument).
+    
+    Returns:
+        Card HTML for each item returned by load_latest_news, in order.
+    """
+    return [render_news_card(news) for news in load_latest_news(news_mtime)]
+
+
+@st.cache_data(show_spinner=False)
+def render_interview_html(news_mtime: float, news_id: int) -> tuple[str, str]:
+    """
+    Render the subtitle and content HTML of a news item's interview dialog.
+    
+    Cached until news.json changes, so reopening the dialog emits the
+    prepared HTML without redoing the content substitution.
+    
+    Args:
+        news_mtime: Modification time of news.json (cache key and
+            load_latest_news argument).
+        news_id: Id of the news item whose modal is shown.
+    
+    Returns:
+        Tuple of (subtitle HTML, content HTML).
+    """
+    news = next(item for item in load_latest_news(news_mtime) if item.get("id") == news_id)
+    modal_data = news.get("modalContent", {})
+    
+    # Point the banner image path in content at its static URL
+    modal_content = modal_data.get('content', '')
+    modal_content = modal_content.replace(
+        "assets/interview_erik/interview_banner.png",
+        f"{STATIC_URL}/interview_erik/interview_banner.png"
+    )
+    
+    return (
+        INTERVIEW_SUBTITLE_HTML.format(subtitle=modal_data.get('subtitle', '')),
+        INTERVIEW_CONTENT_HTML.format(content=modal_content),
+    )
+
+
+def render_interview(news_mtime: float, news_id: int) -> None:
+    """
+    Render the body of the interview dialog.
+    
+    Args:
+        news_mtime: Modification time of news.json.
+        news_id: Id of the news item whose modal is shown.
+    """
+    subtitle_html, content_html = render_interview_html(news_mtime, news_id)
+    st.markdown(subtitle_html, unsafe_allow_html=True)
+    st.markdown(content_html, unsafe_allow_html=True)
+
+
+def show_interview(news: dict, news_mtime: float) -> None:
+    """
+    Open the interview dialog for a news item.
+    
+    Only called while the item's modal flag is set, so the dialog is built
+    for the requested news item alone. The dialog title comes from the
+    item, so st.dialog is applied here rather than as a decorator on
+    render_interview.
+    
+    Args:
+        news: News item as loaded from news.json.
+        news_mtime: Modification time of news.json.
+    """
+    title = news.get("modalContent", {}).get("title", news["title"])
+    st.dialog(title, width="large")(render_interview)(news_mtime, news["id"])
+
+
+@st.fragment
+def render_news_section() -> None:
+    """
+    Render the Latest News column: the news cards and the interview modal.
+    
+    Runs as a fragment, so opening the interview only reruns this section
+    instead of the whole home page.
+    """
+    # Latest News in the main area
+    st.markdown("<h2 style='font-size: 1.5rem;'>► Latest News</h2>", unsafe_allow_html=True)
+    
+    # Load news from JSON (newest first, max 5 items)
+    if NEWS_FILE.exists():
+        news_mtime = NEWS_FILE.stat().st_mtime
+        news_items = load_latest_news(news_mtime)
+        news_cards = render_news_cards(news_mtime)
+        
+        # Card HTML is collected and emitted with a single st.markdown call;
+        # the batch is only flushed early where a modal button must follow.
+        # Cards are separated by a blank line so each one starts its own
+        # HTML block (indented cards would otherwise render as code).
+        card_parts = []
+        
+        for news, card_html in zip(news_items, news_cards):
+            card_parts.append(card_html)
+            
+            # Check if news has modal
+            has_modal = news.get("hasModal", False)
+            
+            # If news has modal, create a button to open it
+            if has_modal:
+                st.markdown("\n\n".join(card_parts), unsafe_allow_html=True)
+                card_parts = []
+                
+                if st.button(f"Read Full Interview", key=f"btn_{news['id']}", use_container_width=True):
+                    st.session_state[f"show_modal_{news['id']}"] = True
+                
+                # Show modal if triggered
+                if st.session_state.get(f"show_modal_{news['id']}", False):
+                    show_interview(news, news_mtime)
+                    # Clear the flag after modal closes
+                    st.session_state[f"show_modal_{news['id']}"] = False
+                
+                st.markdown("<div style='margin-bottom: 1rem;'></div>", unsafe_allow_html=True)
+        
+        if card_parts:
+            st.markdown("\n\n".join(card_parts), unsafe_allow_html=True)
+    else:
+        st.info("No news available yet.")
 
 
 def main() -> None:
@@ -48,100 +414,9 @@ def main() -> None:
     track_page_view("Home", session_id)
     
     # Large centered logo with subtitle and rotworm gif
-    logo_path = Path("assets/logo_fibulopedia.png")
-    rotworm_path = Path("assets/monsters/rotworm.gif")
-    
-    if logo_path.exists():
-        with open(logo_path, "rb") as f:
-            logo_data = base64.b64encode(f.read()).decode()
-        
-        rotworm_data = ""
-        if rotworm_path.exists():
-            with open(rotworm_path, "rb") as f:
-                rotworm_data = base64.b64encode(f.read()).decode()
-        
-        st.markdown(f"""
-            <style>
-                .main-logo-container {{
-                    text-align: center;
-                    margin: -3rem 0 0.5rem 0;
-                    padding-top: 0;
-                    animation: fadeInDown 1s ease-out;
-                    position: relative;
-                }}
-                .main-logo-container img.logo {{
-                    max-width: 450px;
-                    width: 100%;
-                    height: auto;
-                    filter: drop-shadow(0 0 20px rgba(212, 175, 55, 0.4));
-                    transition: transform 0.3s ease, filter 0.3s ease;
-                }}
-                .main-logo-container img.logo:hover {{
-                    transform: scale(1.02);
-                    filter: drop-shadow(0 0 30px rgba(212, 175, 55, 0.6));
-                }}
-                .rotworm-gif {{
-                    position: absolute;
-                    top: 50%;
-                    right: calc(50% - 250px);
-                    transform: translateY(-50%);
-                    width: 96px;
-                    height: 96px;
-                    image-rendering: pixelated;
-                    animation: fadeIn 2s ease-out;
-                    z-index: 10;
-                }}
-                .main-subtitle {{
-                    text-align: center;
-                    font-size: 1.4rem;
-                    color: #d4af37;
-                    font-weight: 300;
-                    font-style: italic;
-                    margin-top: 0.5rem;
-                    margin-bottom: 0.5rem;
-                    text-shadow: 0 0 15px rgba(212, 175, 55, 0.5), 0 0 30px rgba(212, 175, 55, 0.2);
-                    animation: fadeIn 1.5s ease-out;
-                    letter-spacing: 0.5px;
-                }}
-                .online-status {{
-                    text-align: center;
-                    font-size: 1.1rem;
-                    color: #50c878;
-                    margin-bottom: 1.5rem;
-                    animation: fadeIn 2s ease-out;
-                }}
-                .online-status .count {{
-                    font-weight: bold;
-                    font-size: 1.3rem;
-                    text-shadow: 0 0 10px rgba(80, 200, 120, 0.5);
-                }}
-                @keyframes fadeInDown {{
-                    from {{
-                        opacity: 0;
-                        transform: translateY(-20px);
-                    }}
-                    to {{
-                        opacity: 1;
-                        transform: translateY(0);
-                    }}
-                }}
-                @keyframes fadeIn {{
-                    from {{
-                        opacity: 0;
-                    }}
-                    to {{
-                        opacity: 1;
-                    }}
-                }}
-            </style>
-            <div class="main-logo-container">
-                <img class="logo" src="data:image/png;base64,{logo_data}" alt="Fibulopedia">
-                {"<img class='rotworm-gif' src='data:image/gif;base64," + rotworm_data + "' alt='Rotworm'>" if rotworm_data else ""}
-            </div>
-            <div class="main-subtitle">
-                Your ultimate community hub and knowledge base for Fibula Project
-            </div>
-        """, unsafe_allow_html=True)
+    available_assets = get_available_assets()
+    if available_assets[LOGO_PATH]:
+        st.markdown(LOGO_BLOCK_HTML[available_assets[ROTWORM_PATH]], unsafe_allow_html=True)
         
         # Note: Online player count feature is disabled due to Cloudflare protection
         # on the MyAAC website preventing automated scraping
@@ -170,276 +445,22 @@ def main() -> None:
     col_main, col_sidebar = st.columns([3, 1])
     
     with col_main:
-        # Latest News in the main area
-        st.markdown("<h2 style='font-size: 1.5rem;'>► Latest News</h2>", unsafe_allow_html=True)
-        
-        # Load news from JSON
-        news_file = Path("content/news.json")
-        if news_file.exists():
-            with open(news_file, "r", encoding="utf-8") as f:
-                news_items = json.load(f)
-            
-            # Sort by date (newest first) and show max 5 items
-            news_items = sorted(news_items, key=lambda x: x["date"], reverse=True)[:5]
-            
-            for news in news_items:
-                # Category badge color
-                category_colors = {
-                    "announcement": "#4a90e2",
-                    "update": "#50c878",
-                    "info": "#ffd700",
-                    "event": "#ff6347",
-                    "interview": "#9b59b6"
-                }
-                badge_color = category_colors.get(news.get("category", "info"), "#ffd700")
-                
-                # Check if news has modal
-                has_modal = news.get("hasModal", False)
-                
-                # Define news thumbnails mapping
-                news_thumbnails = {
-                    5: "assets/interview_erik/interview_banner_small.png",
-                    4: "assets/news_thumbnail/training_calculator.png",
-                    3: "assets/news_thumbnail/december_update_2.png",
-                    2: "assets/news_thumbnail/december_update_1.png",
-                    1: "assets/logo_transparent.png"
-                }
-                
-                # Check if this news has a thumbnail
-                news_id = news.get('id')
-                if news_id in news_thumbnails:
-                    # Load news thumbnail image
-                    thumbnail_path = Path(news_thumbnails[news_id])
-                    thumbnail_data = ""
-                    if thumbnail_path.exists():
-                        with open(thumbnail_path, "rb") as f:
-                            thumbnail_data = base64.b64encode(f.read()).decode()
-                    
-                    st.markdown(f"""
-                        <div style="
-                            background: linear-gradient(135deg, rgba(30,30,30,0.95), rgba(40,40,40,0.95));
-                            border-left: 3px solid #d4af37;
-                            border-radius: 8px;
-                            padding: 1.5rem;
-                            margin-bottom: 1rem;
-                            transition: all 0.3s ease;
-                        ">
-                            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.75rem;">
-                                <span style="
-                                    background: {badge_color};
-                                    color: white;
-                                    padding: 0.3rem 0.7rem;
-                                    border-radius: 4px;
-                                    font-size: 0.75rem;
-                                    text-transform: uppercase;
-                                    font-weight: bold;
-                                ">{news.get('category', 'info')}</span>
-                                <span style="color: #888; font-size: 0.9rem;">{news['date']}</span>
-                            </div>
-                            <div style="display: flex; gap: 1.5rem; align-items: flex-start;">
-                                <div style="flex: 1; min-width: 0;">
-                                    <h3 style="color: #d4af37; margin: 0.5rem 0; font-size: 1.1rem;">{news['title']}</h3>
-                                    <p style="color: #ccc; margin: 1rem 0 0 0; font-size: 0.9rem; line-height: 1.5;">{news['content']}</p>
-                                    <div style="color: #888; font-size: 0.85rem; margin-top: 0.75rem; font-style: italic;">
-                                        — {news.get('author', 'Admin')}
-                                    </div>
-                                </div>
-                                <div style="flex-shrink: 0; margin-top: 1rem;">
-                                    <img src="data:image/png;base64,{thumbnail_data}" 
-                                         alt="News Thumbnail" 
-                                         style="width: 280px; border-radius: 6px; object-fit: cover;">
-                                </div>
-                            </div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                        <div style="
-                            background: linear-gradient(135deg, rgba(30,30,30,0.95), rgba(40,40,40,0.95));
-                            border-left: 3px solid #d4af37;
-                            border-radius: 8px;
-                            padding: 1.5rem;
-                            margin-bottom: 1rem;
-                            transition: all 0.3s ease;
-                        ">
-                            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.75rem;">
-                                <span style="
-                                    background: {badge_color};
-                                    color: white;
-                                    padding: 0.3rem 0.7rem;
-                                    border-radius: 4px;
-                                    font-size: 0.75rem;
-                                    text-transform: uppercase;
-                                    font-weight: bold;
-                                ">{news.get('category', 'info')}</span>
-                                <span style="color: #888; font-size: 0.9rem;">{news['date']}</span>
-                            </div>
-                            <h3 style="color: #d4af37; margin: 0.5rem 0; font-size: 1.1rem;">{news['title']}</h3>
-                            <p style="color: #ccc; margin: 1rem 0 0 0; font-size: 0.9rem; line-height: 1.5;">{news['content']}</p>
-                            <div style="color: #888; font-size: 0.85rem; margin-top: 0.75rem; font-style: italic;">
-                                — {news.get('author', 'Admin')}
-                            </div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                
-                # If news has modal, create a button to open it
-                if has_modal:
-                    if st.button(f"Read Full Interview", key=f"btn_{news['id']}", use_container_width=True):
-                        st.session_state[f"show_modal_{news['id']}"] = True
-                    
-                    # Show modal if triggered
-                    if st.session_state.get(f"show_modal_{news['id']}", False):
-                        modal_data = news.get("modalContent", {})
-                        
-                        # Load interview banner for modal
-                        modal_banner_path = Path("assets/interview_erik/interview_banner.png")
-                        modal_banner_data = ""
-                        if modal_banner_path.exists():
-                            with open(modal_banner_path, "rb") as f:
-                                modal_banner_data = base64.b64encode(f.read()).decode()
-                        
-                        # Replace the banner image path in content with base64
-                        modal_content = modal_data.get('content', '')
-                        modal_content = modal_content.replace(
-                            "assets/interview_erik/interview_banner.png",
-                            f"data:image/png;base64,{modal_banner_data}"
-                        )
-                        
-                        @st.dialog(modal_data.get("title", news["title"]), width="large")
-                        def show_interview():
-                            st.markdown(f"""
-                                <style>
-                                    .interview-content h3 {{
-                                        color: #d4af37;
-                                        font-size: 1.5rem;
-                                        font-weight: bold;
-                                        margin-top: 3rem;
-                                        margin-bottom: 1.5rem;
-                                        padding-bottom: 0.5rem;
-                                        border-bottom: 2px solid #d4af37;
-                                    }}
-                                    .interview-content h4 {{
-                                        color: #d4af37;
-                                        font-size: 1.1rem;
-                                        font-weight: bold;
-                                        margin-top: 1.5rem;
-                                        margin-bottom: 0.75rem;
-                                    }}
-                                    .interview-content p {{
-                                        margin-bottom: 1.25rem;
-                                    }}
-                                    .interview-content blockquote.pull-quote {{
-                                        margin: 2.5rem 0;
-                                    }}
-                                </style>
-                                <div style="
-                                    color: #d4af37;
-                                    font-size: 1.2rem;
-                                    font-style: italic;
-                                    margin-bottom: 2rem;
-                                    border-left: 3px solid #d4af37;
-                                    padding-left: 1rem;
-                                ">
-                                    {modal_data.get('subtitle', '')}
-                                </div>
-                            """, unsafe_allow_html=True)
-                            
-                            st.markdown(f"""
-                                <div class="interview-content" style="
-                                    color: #ccc;
-                                    font-size: 1rem;
-                                    line-height: 1.8;
-                                ">
-                                    {modal_content}
-                                </div>
-                            """, unsafe_allow_html=True)
-                        
-                        show_interview()
-                        # Clear the flag after modal closes
-                        st.session_state[f"show_modal_{news['id']}"] = False
-                    
-                    st.markdown("<div style='margin-bottom: 1rem;'></div>", unsafe_allow_html=True)
-        else:
-            st.info("No news available yet.")
+        render_news_section()
     
     with col_sidebar:
         # Add spacer to align welcome box with Latest News header
         st.markdown("<div style='margin-top: 2.5rem;'></div>", unsafe_allow_html=True)
         
         # Welcome box moved to sidebar with avatar
-        grozze_path = Path("assets/grozze.png")
-        grozze_data = ""
-        if grozze_path.exists():
-            with open(grozze_path, "rb") as f:
-                grozze_data = base64.b64encode(f.read()).decode()
-        
-        st.markdown(f"""
-            <style>
-            .welcome-box {{
-                background: linear-gradient(135deg, rgba(30,30,30,0.95), rgba(40,40,40,0.95));
-                border: 2px solid #d4af37;
-                border-radius: 12px;
-                padding: 1.25rem 1.25rem;
-                margin: 0 0 1.25rem 0;
-                text-align: center;
-                box-shadow: 0 4px 20px rgba(212, 175, 55, 0.2);
-                animation: fadeInUp 0.8s ease-out;
-            }}
-            .welcome-box h1 {{
-                color: #d4af37;
-                margin-bottom: 0.5rem;
-                font-size: 1.6rem;
-            }}
-            .welcome-box p {{
-                color: #cccccc;
-                line-height: 1.5;
-                margin-bottom: 0.25rem;
-                font-size: 0.9rem;
-            }}
-            .welcome-box img.avatar {{
-                width: 160px;
-                height: 160px;
-                border-radius: 50%;
-                border: 3px solid #d4af37;
-                margin-bottom: 0.75rem;
-                box-shadow: 0 0 15px rgba(212, 175, 55, 0.4);
-                transition: transform 0.3s ease;
-            }}
-            .welcome-box img.avatar:hover {{
-                transform: scale(1.1);
-            }}
-            </style>
-            <div class="welcome-box">
-                {"<img class='avatar' src='data:image/png;base64," + grozze_data + "' alt='Grozze'>" if grozze_data else ""}
-                <h1>Welcome to Fibulopedia</h1>
-                <p>Your comprehensive guide to the Fibula Project - a faithful recreation of the classic Tibia 7.1 experience.</p>
-                <p>Explore weapons, equipment, spells, monsters, quests, and more.</p>
-                <p>Molot (Grozze in-game)</p>
-            </div>
-        """, unsafe_allow_html=True)
+        avatar_html = (
+            f"<img class='avatar' src='{STATIC_URL}/grozze.png' alt='Grozze' decoding='async'>"
+            if available_assets[GROZZE_PATH] else ""
+        )
+        st.markdown(WELCOME_BOX_HTML.format(avatar_html=avatar_html), unsafe_allow_html=True)
         
         # Quick Links section
         st.markdown("<h2 style='font-size: 1.3rem;'>▶ Quick Links</h2>", unsafe_allow_html=True)
-        st.markdown("""
-            <div style="
-                background: rgba(40,40,40,0.4);
-                border: 2px solid #d4af37;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            ">
-                <p style="margin: 0.5rem 0;">
-                    <a href="https://amera.fibula.app/" target="_blank" style="color: #d4af37; text-decoration: none; font-size: 1.1rem; font-weight: bold;">
-                        🌐 Project Fibula Official Website
-                    </a>
-                </p>
-                <p style="margin: 0.5rem 0;">
-                    <a href="https://discord.gg/Jzz6yUme" target="_blank" style="color: #7289da; text-decoration: none; font-size: 1.1rem; font-weight: bold;">
-                        💬 Project Fibula Discord
-                    </a>
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(QUICK_LINKS_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
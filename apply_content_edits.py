@@ -0,0 +1,56 @@
+"""
+Script to apply all interview content edits to news.json in one go.
+
+This script runs the edits from fix_youtube_answer_style.py and
+fix_pull_quotes_placement.py on the interview's modal content:
+1. Restyle the YouTube question answer as a paragraph
+2. Place every pull quote after the paragraph it is taken from
+
+news.json is parsed and written once for both edits, instead of once per
+script. Each script can still be run on its own.
+
+Run this script from the project root directory.
+"""
+
+import orjson
+
+from fix_pull_quotes_placement import fix_pull_quotes
+from fix_youtube_answer_style import fix_youtube_answer_style
+from news_content import NEWS_PATH, save_content
+
+
+def apply_edits(content: str) -> str:
+    """
+    Apply every interview content edit.
+    
+    Args:
+        content: The interview's modal content HTML.
+    
+    Returns:
+        The edited content (equal to the input if nothing needed to change).
+    """
+    content = fix_youtube_answer_style(content)
+    content = fix_pull_quotes(content)
+    return content
+
+
+def main():
+    """Main function to apply the content edits to news.json."""
+    raw = NEWS_PATH.read_bytes()
+    data = orjson.loads(raw)
+    
+    content = data[0]['modalContent']['content']
+    new_content = apply_edits(content)
+    
+    if new_content == content:
+        print("✓ No changes needed")
+        return
+    
+    # Save back by splicing only the edited content string into the file
+    save_content(raw, orjson.dumps(content), new_content, data)
+    
+    print("✓ Interview content updated")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,8 @@ This script updates weapons.json, equipment.json, and tools.json to:
 Run this script from the project root directory.
 """
 
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # File paths
@@ -24,59 +25,67 @@ FILES_TO_CLEAN = [
 ]
 
 
-def clean_json_file(file_path: Path) -> None:
+def clean_json_file(file_path: Path) -> str:
     """
     Clean a single JSON file by removing buy_from and ensuring sell_to exists.
     
+    Files are cleaned concurrently, so progress is collected into a report
+    instead of being printed as it happens.
+    
     Args:
         file_path: Path to the JSON file to clean.
+    
+    Returns:
+        The progress report for this file.
     """
-    print(f"\nProcessing: {file_path.name}")
+    report = [f"\nProcessing: {file_path.name}"]
     
     if not file_path.exists():
-        print(f"  ⚠️  File not found, skipping...")
-        return
+        report.append(f"  ⚠️  File not found, skipping...")
+        return "\n".join(report)
     
     try:
         # Load JSON data
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(file_path.read_bytes())
         
         if not isinstance(data, list):
-            print(f"  ⚠️  Expected list, got {type(data)}, skipping...")
-            return
+            report.append(f"  ⚠️  Expected list, got {type(data)}, skipping...")
+            return "\n".join(report)
+        
+        # Tally the changes first, so a clean file is never rebuilt
+        items = [item for item in data if isinstance(item, dict)]
+        buy_from_removed = sum("buy_from" in item for item in items)
+        sell_to_added = sum("sell_to" not in item for item in items)
         
-        # Track statistics
-        buy_from_removed = 0
-        sell_to_added = 0
+        report.append(f"  ✓ Processed {len(data)} items")
         
-        # Process each item
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            
-            # Remove buy_from if it exists
-            if "buy_from" in item:
-                del item["buy_from"]
-                buy_from_removed += 1
-            
-            # Add sell_to if it doesn't exist
-            if "sell_to" not in item:
-                item["sell_to"] = []
-                sell_to_added += 1
+        # Already-clean files are left untouched instead of re-serialized
+        if not (buy_from_removed or sell_to_added):
+            report.append("  ✓ No changes needed")
+            return "\n".join(report)
+        
+        # Rebuild each item in one pass: drop buy_from and default sell_to.
+        # The "sell_to" key keeps its position when present and is appended
+        # otherwise, matching the previous in-place edits.
+        data = [
+            {**{key: value for key, value in item.items() if key != "buy_from"},
+             "sell_to": item.get("sell_to", [])}
+            if isinstance(item, dict) else item
+            for item in data
+        ]
         
         # Save cleaned data
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
-        print(f"  ✓ Processed {len(data)} items")
-        print(f"  ✓ Removed buy_from from {buy_from_removed} items")
-        print(f"  ✓ Added sell_to to {sell_to_added} items")
+        report.append(f"  ✓ Removed buy_from from {buy_from_removed} items")
+        report.append(f"  ✓ Added sell_to to {sell_to_added} items")
         
-    except json.JSONDecodeError as e:
-        print(f"  ✗ JSON decode error: {e}")
+    except orjson.JSONDecodeError as e:
+        report.append(f"  ✗ JSON decode error: {e}")
     except Exception as e:
-        print(f"  ✗ Error: {e}")
+        report.append(f"  ✗ Error: {e}")
+    
+    return "\n".join(report)
 
 
 def main():
@@ -89,8 +98,11 @@ def main():
     print("  2. Ensure all items have 'sell_to' field (empty array if missing)")
     print()
     
-    for file_path in FILES_TO_CLEAN:
-        clean_json_file(file_path)
+    # The files are independent, so clean them concurrently; map() yields
+    # the reports in FILES_TO_CLEAN order, keeping the output stable
+    with ThreadPoolExecutor(max_workers=len(FILES_TO_CLEAN)) as executor:
+        for report in executor.map(clean_json_file, FILES_TO_CLEAN):
+            print(report)
     
     print("\n" + "=" * 60)
     print("CLEANUP COMPLETE!")
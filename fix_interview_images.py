@@ -1,45 +1,50 @@
-import json
-import base64
-from pathlib import Path
+import mmap
+import re
+
+from news_content import read_news, save_news
+
+# pybase64 uses SIMD kernels and is a drop-in replacement for the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 def image_to_base64(image_path):
     """Convert image to base64 string"""
-    with open(image_path, 'rb') as img_file:
-        return base64.b64encode(img_file.read()).decode()
+    # Map the file instead of reading it so the raw bytes are never copied
+    with open(image_path, 'rb') as img_file, mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return base64.b64encode(mm).decode()
 
 # Load news.json
-with open('content/news.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+data = read_news()
 
-# Convert images to base64
-eric_stream_b64 = image_to_base64('assets/interview_erik/eric_stream.png')
-erik_char_b64 = image_to_base64('assets/interview_erik/erik_char.jpg')
-gmerik_b64 = image_to_base64('assets/interview_erik/gmerik.png')
+# Interview images to embed, with the MIME type of their data URI
+IMAGES = [
+    ('eric_stream.png', 'image/png'),
+    ('erik_char.jpg', 'image/jpeg'),
+    ('gmerik.png', 'image/png'),
+]
 
 # Get the interview content
 content = data[0]['modalContent']['content']
 
-# Replace image paths with base64 data URIs
-content = content.replace(
-    "src='assets/interview_erik/eric_stream.png'",
-    f"src='data:image/png;base64,{eric_stream_b64}'"
-)
+# Replace image paths with base64 data URIs in a single pass over the
+# content. Each image is encoded only when its src is matched, so only one
+# encoded image is held in memory alongside the content at a time.
+IMAGE_MIMES = {f"src='assets/interview_erik/{filename}'": (filename, mime) for filename, mime in IMAGES}
+IMAGE_SRC_PATTERN = re.compile("|".join(re.escape(src) for src in IMAGE_MIMES))
 
-content = content.replace(
-    "src='assets/interview_erik/erik_char.jpg'",
-    f"src='data:image/jpeg;base64,{erik_char_b64}'"
-)
+def embed_image(match):
+    """Return the data URI src attribute for a matched image src."""
+    filename, mime = IMAGE_MIMES[match.group(0)]
+    return f"src='data:{mime};base64,{image_to_base64(f'assets/interview_erik/{filename}')}'"
 
-content = content.replace(
-    "src='assets/interview_erik/gmerik.png'",
-    f"src='data:image/png;base64,{gmerik_b64}'"
-)
+content = IMAGE_SRC_PATTERN.sub(embed_image, content)
 
 # Update the content
 data[0]['modalContent']['content'] = content
 
-# Save back to JSON
-with open('content/news.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=4, ensure_ascii=False)
+# Save back to JSON via a temp file so an interrupted run can't truncate it
+save_news(data)
 
 print("Done! Images converted to base64 and embedded in JSON.")
@@ -1,106 +1,116 @@
-import json
-import re
+import orjson
 
-# Load current news.json
-with open('content/news.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from news_content import NEWS_PATH, save_content
 
-content = data[0]['modalContent']['content']
+# Pull quote markup around the quote text
+PULL_QUOTE_PREFIX = "\n<blockquote class='pull-quote' style='font-size: 1.3rem; font-style: italic; color: #d4af37; border-left: 4px solid #d4af37; padding-left: 1.5rem; margin: 2rem 0;'>"
+PULL_QUOTE_SUFFIX = "</blockquote>\n"
 
-# Remove all existing pull quotes first
-content = re.sub(r'\n<blockquote class=\'pull-quote\'.*?</blockquote>\n', '', content, flags=re.DOTALL)
-
-# Pull quote template
 def make_pull_quote(text):
-    return f"\n<blockquote class='pull-quote' style='font-size: 1.3rem; font-style: italic; color: #d4af37; border-left: 4px solid #d4af37; padding-left: 1.5rem; margin: 2rem 0;'>{text}</blockquote>\n"
-
-# Now add pull quotes in the CORRECT locations based on where the text actually appears
-
-# 1. "I had absolutely no idea how big this would get."
-content = content.replace(
-    "We had maybe… 100 people on Discord? I had no clue how much this project was going to grow!</p>",
-    "We had maybe… 100 people on Discord? I had no clue how much this project was going to grow!</p>" + 
-    make_pull_quote('"I had absolutely no idea how big this would get."')
-)
-
-# 2. "Whenever a small group can ruin the experience for the majority, that's where the line is."
-content = content.replace(
-    "Sure, this happens on main, but at least the majority collectively have the tools to do something about it.</p>",
-    "Sure, this happens on main, but at least the majority collectively have the tools to do something about it.</p>" + 
-    make_pull_quote('"Whenever a small group can ruin the experience for the majority, that\'s where the line is."')
-)
-
-# 3. "There's no perfect version of Tibia."
-content = content.replace(
-    "Each major version has pros and cons, and I'd love to see Project Fibula visit all of them someday, but for now we'll see how it goes until 7.6.</p>",
-    "Each major version has pros and cons, and I'd love to see Project Fibula visit all of them someday, but for now we'll see how it goes until 7.6.</p>" + 
-    make_pull_quote('"There\'s no perfect version of Tibia."')
-)
-
-# 4. "I don't think I've ever felt worse in my life."
-content = content.replace(
-    "There has been no worse feeling in my recent memory.</p>",
-    "There has been no worse feeling in my recent memory.</p>" + 
-    make_pull_quote('"I don\'t think I\'ve ever felt worse in my life."')
-)
-
-# 5. "Communication and trust are everything."
-content = content.replace(
-    "With each mistake I've made, I've asked myself what I can do to stop it from happening again.</p>",
-    "With each mistake I've made, I've asked myself what I can do to stop it from happening again.</p>" + 
-    make_pull_quote('"Communication and trust are everything."')
-)
-
-# 6. "No one is immune, and we will find out eventually."
-content = content.replace(
-    "Who knows if they would have gotten to where they are without the head start cheating gave them.</p>",
-    "Who knows if they would have gotten to where they are without the head start cheating gave them.</p>" + 
-    make_pull_quote('"No one is immune, and we will find out eventually."')
-)
-
-# 7. "Players need to realize that their automations are why Tibia is the way it is."
-content = content.replace(
-    "The Char Bazaar was added to combat account trading.</p>",
-    "The Char Bazaar was added to combat account trading.</p>" + 
-    make_pull_quote('"Players need to realize that their automations are why Tibia is the way it is."')
-)
-
-# 8. "Project Fibula feels different because it forces people to interact."
-content = content.replace(
-    "It makes you pause at times, forces you to talk to other players, gives you a sense of accomplishment, and much more — all things modern games no longer do.</p>",
-    "It makes you pause at times, forces you to talk to other players, gives you a sense of accomplishment, and much more — all things modern games no longer do.</p>" + 
-    make_pull_quote('"Project Fibula feels different because it forces people to interact."')
-)
-
-# 9. "This server is nothing without community."
-content = content.replace(
-    "I really enjoyed watching those groups play.</p>",
-    "I really enjoyed watching those groups play.</p>" + 
-    make_pull_quote('"This server is nothing without community."')
-)
-
-# 10. "I would rather have a lively world filled with a good community that pays me nothing."
-content = content.replace(
-    "I would rather have a lively world filled with a good community that pays me nothing than a worse world filled with people willing to give me $10 a month.</p>",
-    "I would rather have a lively world filled with a good community that pays me nothing than a worse world filled with people willing to give me $10 a month.</p>" + 
-    make_pull_quote('"I would rather have a lively world filled with a good community that pays me nothing."')
-)
-
-# 11. "It's basically ruined my life — but I wouldn't trade this experience for anything."
-content = content.replace(
-    "We are not going to forget Project Fibula, and that's really cool to think about.</p>",
-    "We are not going to forget Project Fibula, and that's really cool to think about.</p>" + 
-    make_pull_quote('"It\'s basically ruined my life — but I wouldn\'t trade this experience for anything."')
-)
-
-# 12. "We are not going to forget Project Fibula."
-# This one is already included in #11, so we skip it to avoid duplication
-
-# Update content
-data[0]['modalContent']['content'] = content
-
-# Save back
-with open('content/news.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=4)
-
-print("✓ Poprawiono umiejscowienie wszystkich pull quotes!")
+    return PULL_QUOTE_PREFIX + text + PULL_QUOTE_SUFFIX
+
+# Pull quotes in the CORRECT locations based on where the text actually appears:
+# each quote is inserted right after the paragraph (anchor) it is taken from
+PULL_QUOTES = [
+    # 1. "I had absolutely no idea how big this would get."
+    ("We had maybe… 100 people on Discord? I had no clue how much this project was going to grow!</p>",
+     '"I had absolutely no idea how big this would get."'),
+    # 2. "Whenever a small group can ruin the experience for the majority, that's where the line is."
+    ("Sure, this happens on main, but at least the majority collectively have the tools to do something about it.</p>",
+     '"Whenever a small group can ruin the experience for the majority, that\'s where the line is."'),
+    # 3. "There's no perfect version of Tibia."
+    ("Each major version has pros and cons, and I'd love to see Project Fibula visit all of them someday, but for now we'll see how it goes until 7.6.</p>",
+     '"There\'s no perfect version of Tibia."'),
+    # 4. "I don't think I've ever felt worse in my life."
+    ("There has been no worse feeling in my recent memory.</p>",
+     '"I don\'t think I\'ve ever felt worse in my life."'),
+    # 5. "Communication and trust are everything."
+    ("With each mistake I've made, I've asked myself what I can do to stop it from happening again.</p>",
+     '"Communication and trust are everything."'),
+    # 6. "No one is immune, and we will find out eventually."
+    ("Who knows if they would have gotten to where they are without the head start cheating gave them.</p>",
+     '"No one is immune, and we will find out eventually."'),
+    # 7. "Players need to realize that their automations are why Tibia is the way it is."
+    ("The Char Bazaar was added to combat account trading.</p>",
+     '"Players need to realize that their automations are why Tibia is the way it is."'),
+    # 8. "Project Fibula feels different because it forces people to interact."
+    ("It makes you pause at times, forces you to talk to other players, gives you a sense of accomplishment, and much more — all things modern games no longer do.</p>",
+     '"Project Fibula feels different because it forces people to interact."'),
+    # 9. "This server is nothing without community."
+    ("I really enjoyed watching those groups play.</p>",
+     '"This server is nothing without community."'),
+    # 10. "I would rather have a lively world filled with a good community that pays me nothing."
+    ("I would rather have a lively world filled with a good community that pays me nothing than a worse world filled with people willing to give me $10 a month.</p>",
+     '"I would rather have a lively world filled with a good community that pays me nothing."'),
+    # 11. "It's basically ruined my life — but I wouldn't trade this experience for anything."
+    ("We are not going to forget Project Fibula, and that's really cool to think about.</p>",
+     '"It\'s basically ruined my life — but I wouldn\'t trade this experience for anything."'),
+    # 12. "We are not going to forget Project Fibula."
+    # This one is already included in #11, so we skip it to avoid duplication
+]
+
+# Markup delimiting an existing pull quote, removed before the new ones go in
+PULL_QUOTE_OPEN = "\n<blockquote class='pull-quote'"
+PULL_QUOTE_CLOSE = "</blockquote>\n"
+
+# Pull quote HTML for each anchor, built once
+PULL_QUOTE_HTML = [(anchor, make_pull_quote(quote)) for anchor, quote in PULL_QUOTES]
+
+
+def fix_pull_quotes(content):
+    """Return the interview content with every pull quote in its place."""
+    # Every edit is located with literal str.find scans (no regex engine):
+    # old pull quotes become (start, end, '') removals and each anchor an
+    # insertion (end, end, quote) right after it. Sorting puts an insertion
+    # before a removal starting at the same offset, so anchor + new quote
+    # replaces anchor + old quote.
+    edits = []
+    start = content.find(PULL_QUOTE_OPEN)
+    while start != -1:
+        end = content.find(PULL_QUOTE_CLOSE, start)
+        if end == -1:
+            break
+        end += len(PULL_QUOTE_CLOSE)
+        edits.append((start, end, ''))
+        start = content.find(PULL_QUOTE_OPEN, end)
+    
+    for anchor, pull_quote in PULL_QUOTE_HTML:
+        position = content.find(anchor)
+        while position != -1:
+            end = position + len(anchor)
+            edits.append((end, end, pull_quote))
+            position = content.find(anchor, end)
+    
+    # Copy the untouched slices and the replacements in one pass
+    edits.sort()
+    parts = []
+    position = 0
+    for start, end, replacement in edits:
+        parts.append(content[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(content[position:])
+    return ''.join(parts)
+
+
+def main():
+    # Load current news.json
+    raw = NEWS_PATH.read_bytes()
+    data = orjson.loads(raw)
+    
+    content = data[0]['modalContent']['content']
+    new_content = fix_pull_quotes(content)
+    
+    # Nothing to write if every pull quote is already in place
+    if new_content == content:
+        print("✓ Pull quotes są już na właściwych miejscach — brak zmian.")
+        return
+    
+    # Save back by splicing only the edited content string into the file
+    save_content(raw, orjson.dumps(content), new_content, data)
+    
+    print("✓ Poprawiono umiejscowienie wszystkich pull quotes!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,45 @@
-import json
+import orjson
 
-# Load current interview content
-with open('content/news.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from news_content import NEWS_PATH, save_content
 
-content = data[0]['modalContent']['content']
+# ASCII literal from the old answer markup; the converted answer no longer
+# contains it, so a raw substring check can skip parsing a fixed file
+OLD_ANSWER_MARKER = b'<blockquote>Having a background on YouTube certainly helped'
 
 # Replace blockquote with p for the YouTube question answer
-old_text = """<h4>Q: How has the popularity of your YouTube presence helped—and how has it challenged—the launch of the project?</h4>
+OLD_TEXT = """<h4>Q: How has the popularity of your YouTube presence helped—and how has it challenged—the launch of the project?</h4>
 <blockquote>Having a background on YouTube certainly helped bring the initial players to the project; without it, nobody outside of my close friends would have logged in. However, you are absolutely right that it has also introduced its own challenges. I was not only the initial promoter—the friendly guy encouraging people to relive the nostalgia—but I am now also the administrator. I am responsible for every server issue, every ban, every cheater operating on the fringes, every message sent on Discord—the list goes on. This has led to many difficult moments and has damaged several good relationships I had before launching the server.</blockquote>"""
 
-new_text = """<h4>Q: How has the popularity of your YouTube presence helped—and how has it challenged—the launch of the project?</h4>
+NEW_TEXT = """<h4>Q: How has the popularity of your YouTube presence helped—and how has it challenged—the launch of the project?</h4>
 <p><strong>Erik:</strong><br/>Having a background on YouTube certainly helped bring the initial players to the project; without it, nobody outside of my close friends would have logged in. However, you are absolutely right that it has also introduced its own challenges. I was not only the initial promoter—the friendly guy encouraging people to relive the nostalgia—but I am now also the administrator. I am responsible for every server issue, every ban, every cheater operating on the fringes, every message sent on Discord—the list goes on. This has led to many difficult moments and has damaged several good relationships I had before launching the server.</p>"""
 
-if old_text in content:
-    new_content = content.replace(old_text, new_text)
+
+def fix_youtube_answer_style(content):
+    """Return the interview content with the YouTube answer restyled."""
+    return content.replace(OLD_TEXT, NEW_TEXT)
+
+
+def main():
+    raw = NEWS_PATH.read_bytes()
+    if OLD_ANSWER_MARKER not in raw:
+        print("✗ Could not find the text to replace")
+        return
     
-    # Update the JSON
-    data[0]['modalContent']['content'] = new_content
+    # Load current interview content
+    data = orjson.loads(raw)
     
-    # Save back to file
-    with open('content/news.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    content = data[0]['modalContent']['content']
     
-    print("✓ Successfully fixed YouTube answer style!")
-else:
-    print("✗ Could not find the text to replace")
+    if OLD_TEXT in content:
+        new_content = fix_youtube_answer_style(content)
+        
+        # Save back by splicing only the edited content string into the file
+        save_content(raw, orjson.dumps(content), new_content, data)
+        
+        print("✓ Successfully fixed YouTube answer style!")
+    else:
+        print("✗ Could not find the text to replace")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Shared helpers for the scripts that edit the interview in news.json.
+
+The add_* and fix_* scripts all load content/news.json, edit the
+interview's modal content and write the file back. These helpers keep that
+in one place:
+1. read_news() parses news.json
+2. exit_if_applied() ends the script when the HTML it inserts is present
+3. save_news() writes news.json through a temp file
+4. save_content() splices one edited content string into the raw file
+
+Run the scripts using this module from the project root directory.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import orjson
+
+NEWS_PATH = Path('content/news.json')
+
+
+def read_news():
+    """Load and parse news.json."""
+    return orjson.loads(NEWS_PATH.read_bytes())
+
+
+def exit_if_applied(content: str, inserted_html: str, script_name: str):
+    """
+    Exit the script if its edit is already in the content.
+    
+    Args:
+        content: The interview's modal content HTML.
+        inserted_html: A fragment of the HTML the script inserts. Pick one
+            that later edits (image embedding, restyling) leave intact.
+        script_name: Name shown in the message.
+    """
+    if inserted_html in content:
+        print(f"{script_name} has already been applied, nothing to do.")
+        sys.exit(0)
+
+
+def write_news_bytes(raw: bytes):
+    """
+    Replace news.json with raw bytes.
+    
+    The bytes go to a temp file that then replaces news.json, so an
+    interrupted run can't leave it truncated.
+    """
+    tmp_path = NEWS_PATH.with_suffix('.json.tmp')
+    tmp_path.write_bytes(raw)
+    os.replace(tmp_path, NEWS_PATH)
+
+
+def save_news(data):
+    """Write the news list back to news.json, pretty-printed."""
+    write_news_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def save_content(raw: bytes, old_literal: bytes, new_content: str, data):
+    """
+    Save an edited interview content string to news.json.
+    
+    The new content literal is spliced over the old one in the raw bytes, so
+    only this string is re-serialized and the rest of the file is written
+    back untouched. If the literal isn't found verbatim (e.g. the file was
+    written with different string escaping), the whole list is dumped with
+    the new content instead.
+    
+    Args:
+        raw: news.json's bytes as read before the edit.
+        old_literal: orjson.dumps() of the content before the edit.
+        new_content: The edited content.
+        data: The parsed news list, used for the fallback dump.
+    """
+    start = raw.find(old_literal)
+    if start != -1:
+        write_news_bytes(raw[:start] + orjson.dumps(new_content) + raw[start + len(old_literal):])
+    else:
+        data[0]['modalContent']['content'] = new_content
+        save_news(data)
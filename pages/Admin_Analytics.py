@@ -6,11 +6,9 @@ Access is restricted to administrators only.
 """
 
 import streamlit as st
-import streamlit_analytics2 as streamlit_analytics
-from datetime import datetime
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import heapq
+import hmac
+from operator import itemgetter
 
 from src.ui.layout import (
     setup_page_config,
@@ -21,9 +19,7 @@ from src.ui.layout import (
 )
 from src.logging_utils import setup_logger
 from src.analytics_utils import (
-    get_page_views,
-    get_total_page_views,
-    get_unique_sessions,
+    ANALYTICS_FILE,
     get_analytics_summary,
     reset_analytics,
     get_hourly_activity,
@@ -33,267 +29,193 @@ from src.analytics_utils import (
 
 logger = setup_logger(__name__)
 
+# Number of most viewed pages listed in the breakdown table
+TOP_PAGES = 100
+
+# Stat card shared by the summary and session statistics rows
+STAT_CARD_TEMPLATE = """
+<div style='background: {background}; border: 2px solid {color}; border-radius: 8px; padding: 1.5rem; text-align: center;'>
+<div style='font-size: 2.5rem; font-weight: bold; color: {color};'>{value}</div>
+<div style='font-size: 0.9rem; color: #888; margin-top: 0.5rem;'>{label}</div>
+</div>
+"""
+
+# Admin login prompt, shown until the correct password is entered
+PASSWORD_PROMPT_HTML = """
+<div style="text-align: center; padding: 50px 20px;">
+    <h1 style="color: #d4af37;">🔒 Admin Access Required</h1>
+    <p style="color: #e0e0e0; font-size: 1.1rem;">
+        This page is restricted to administrators only.<br>
+        Please enter the admin password to continue.
+    </p>
+</div>
+"""
+
+SUMMARY_CARD_BACKGROUND = "linear-gradient(135deg, #2d2d2d 0%, #1a1a1a 100%)"
+SESSION_CARD_BACKGROUND = "linear-gradient(135deg, rgba(30,30,30,0.95), rgba(40,40,40,0.95))"
+
 # Configure page
 setup_page_config("Admin Analytics", "📊")
 load_custom_css()
 
 
-def check_password():
-    """Returns True if user entered correct password."""
+def password_entered():
+    """Checks whether a password entered by the user is correct."""
+    # SECURE: Password from secrets, NOT hardcoded!
+    try:
+        ADMIN_PASSWORD = st.secrets["admin_password"]
+    except Exception as e:
+        st.error("⚠️ Admin password not configured. Check secrets.toml")
+        logger.error(f"Error loading admin password: {e}")
+        st.session_state["password_correct"] = False
+        return
     
-    def password_entered():
-        """Checks whether a password entered by the user is correct."""
-        # SECURE: Password from secrets, NOT hardcoded!
-        try:
-            ADMIN_PASSWORD = st.secrets["admin_password"]
-        except Exception as e:
-            st.error("⚠️ Admin password not configured. Check secrets.toml")
-            logger.error(f"Error loading admin password: {e}")
-            st.session_state["password_correct"] = False
-            return
-        
-        if st.session_state["password"] == ADMIN_PASSWORD:
-            st.session_state["password_correct"] = True
-            del st.session_state["password"]  # Don't store password
-        else:
-            st.session_state["password_correct"] = False
-
-    # First run, show password input
-    if "password_correct" not in st.session_state:
-        st.markdown("""
-            <div style="text-align: center; padding: 50px 20px;">
-                <h1 style="color: #d4af37;">🔒 Admin Access Required</h1>
-                <p style="color: #e0e0e0; font-size: 1.1rem;">
-                    This page is restricted to administrators only.<br>
-                    Please enter the admin password to continue.
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            st.text_input(
-                "Admin Password",
-                type="password",
-                on_change=password_entered,
-                key="password",
-                placeholder="Enter admin password..."
-            )
-        return False
+    # Constant-time comparison, so response timing doesn't leak the password
+    if hmac.compare_digest(st.session_state["password"].encode(), str(ADMIN_PASSWORD).encode()):
+        st.session_state["password_correct"] = True
+        del st.session_state["password"]  # Don't store password
+    else:
+        st.session_state["password_correct"] = False
+
+
+def display_password_prompt(error: bool = False):
+    """
+    Display the admin password prompt.
     
-    # Password incorrect
-    elif not st.session_state["password_correct"]:
-        st.markdown("""
-            <div style="text-align: center; padding: 50px 20px;">
-                <h1 style="color: #d4af37;">🔒 Admin Access Required</h1>
-                <p style="color: #e0e0e0; font-size: 1.1rem;">
-                    This page is restricted to administrators only.<br>
-                    Please enter the admin password to continue.
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            st.text_input(
-                "Admin Password",
-                type="password",
-                on_change=password_entered,
-                key="password",
-                placeholder="Enter admin password..."
-            )
+    Args:
+        error: Whether to show the incorrect password message.
+    """
+    st.markdown(PASSWORD_PROMPT_HTML, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.text_input(
+            "Admin Password",
+            type="password",
+            on_change=password_entered,
+            key="password",
+            placeholder="Enter admin password..."
+        )
+        if error:
             st.error("❌ Incorrect password. Please try again.")
+
+
+def check_password():
+    """Returns True if user entered correct password."""
+    # Password not entered yet, or incorrect: show the prompt
+    if not st.session_state.get("password_correct", False):
+        display_password_prompt(error="password_correct" in st.session_state)
         return False
     
     # Password correct
-    else:
-        return True
+    return True
 
 
-def display_analytics_summary():
-    """Display summary statistics in cards."""
-    st.markdown("### 📈 Summary Statistics")
+@st.cache_data(show_spinner=False)
+def load_analytics_summary(mtime: float | None) -> dict:
+    """
+    Load the analytics summary shown on the dashboard.
     
-    # Get our custom analytics data
-    summary = get_analytics_summary()
+    Cached until page_analytics.json changes: callers pass the file's
+    modification time, so a rerun from a button click reuses the previous
+    aggregation and a new page view produces a new cache key.
     
-    col1, col2, col3, col4 = st.columns(4)
+    Args:
+        mtime: Modification time of the analytics file, or None if it
+            doesn't exist yet (cache key only).
     
-    with col1:
-        st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, #2d2d2d 0%, #1a1a1a 100%);
-                border: 2px solid #d4af37;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            '>
-                <div style='font-size: 2.5rem; font-weight: bold; color: #d4af37;'>
-                    {summary['total_page_views']}
-                </div>
-                <div style='font-size: 0.9rem; color: #888; margin-top: 0.5rem;'>
-                    Total Page Views
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+    Returns:
+        Summary dict as returned by get_analytics_summary.
+    """
+    return get_analytics_summary()
+
+
+@st.cache_data(show_spinner=False)
+def load_activity(mtime: float | None) -> dict:
+    """
+    Load the hourly, daily and per-date page view counts for the charts.
     
-    with col2:
-        st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, #2d2d2d 0%, #1a1a1a 100%);
-                border: 2px solid #5ba3d0;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            '>
-                <div style='font-size: 2.5rem; font-weight: bold; color: #5ba3d0;'>
-                    {summary['unique_sessions']}
-                </div>
-                <div style='font-size: 0.9rem; color: #888; margin-top: 0.5rem;'>
-                    Unique Visitors
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, #2d2d2d 0%, #1a1a1a 100%);
-                border: 2px solid #50c878;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            '>
-                <div style='font-size: 2.5rem; font-weight: bold; color: #50c878;'>
-                    {summary['pages_tracked']}
-                </div>
-                <div style='font-size: 0.9rem; color: #888; margin-top: 0.5rem;'>
-                    Pages Tracked
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, #2d2d2d 0%, #1a1a1a 100%);
-                border: 2px solid #e67e22;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            '>
-                <div style='font-size: 2.5rem; font-weight: bold; color: #e67e22;'>
-                    {summary['avg_pages_per_session']}
-                </div>
-                <div style='font-size: 0.9rem; color: #888; margin-top: 0.5rem;'>
-                    Avg Pages/Visit
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-
-
-def display_page_views_table():
-    """Display table of page views."""
-    st.markdown("### 📑 Page Views Breakdown")
+    Cached like load_analytics_summary, so the timeline is only re-read and
+    its timestamps re-parsed when page_analytics.json changes.
     
-    # Get our custom analytics data
-    page_views = get_page_views()
+    Args:
+        mtime: Modification time of the analytics file, or None if it
+            doesn't exist yet (cache key only).
     
-    if not page_views:
-        st.info("No page view data available yet. Start browsing the site to collect data!")
-        return
+    Returns:
+        Dict with "hourly", "daily" and "by_date" view counts.
+    """
+    return {
+        "hourly": get_hourly_activity(),
+        "daily": get_daily_activity(),
+        "by_date": get_activity_by_date(),
+    }
+
+
+def display_stat_cards(cards: list[tuple[str, object, str]], background: str):
+    """
+    Display a row of stat cards, one per column.
     
-    # Sort by views descending
-    sorted_pages = sorted(page_views.items(), key=lambda x: x[1], reverse=True)
+    Args:
+        cards: (color, value, label) for each card, left to right.
+        background: CSS background shared by all cards in the row.
+    """
+    for col, (color, value, label) in zip(st.columns(len(cards)), cards):
+        with col:
+            st.markdown(
+                STAT_CARD_TEMPLATE.format(background=background, color=color, value=value, label=label),
+                unsafe_allow_html=True
+            )
+
+
+def display_analytics_summary(summary: dict):
+    """
+    Display summary statistics in cards.
     
-    # Create styled HTML table
-    table_html = """
-    <style>
-    .analytics-table-container {
-        width: 100%;
-        overflow-x: auto;
-        margin: 20px 0;
-    }
-    .analytics-table {
-        width: 100%;
-        border-collapse: collapse;
-        font-family: 'Arial', sans-serif;
-        background-color: #1a1a1a;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-    }
-    .analytics-table thead {
-        background-color: #2d2d2d;
-    }
-    .analytics-table thead th {
-        background: linear-gradient(180deg, #3d3d3d 0%, #2a2a2a 100%);
-        color: #d4af37;
-        padding: 12px 16px;
-        text-align: left;
-        font-weight: bold;
-        border: 1px solid #4a4a4a;
-        font-size: 14px;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    .analytics-table tbody tr {
-        border-bottom: 1px solid #333;
-    }
-    .analytics-table tbody tr:hover {
-        background-color: #2a2a2a;
-    }
-    .analytics-table tbody tr:nth-child(even) {
-        background-color: #242424;
-    }
-    .analytics-table tbody tr:nth-child(even):hover {
-        background-color: #303030;
-    }
-    .analytics-table tbody td {
-        padding: 12px 16px;
-        text-align: left;
-        border: 1px solid #333;
-        color: #e0e0e0;
-        font-size: 13px;
-    }
-    .analytics-table tbody td:first-child {
-        color: #d4af37;
-        font-weight: bold;
-    }
-    .analytics-table tbody td:last-child {
-        text-align: center;
-        font-weight: bold;
-        color: #5ba3d0;
-    }
-    .rank-badge {
-        display: inline-block;
-        background: #d4af37;
-        color: #1a1a1a;
-        padding: 2px 8px;
-        border-radius: 12px;
-        font-size: 11px;
-        font-weight: bold;
-        margin-right: 8px;
-    }
-    </style>
+    Args:
+        summary: Analytics summary from load_analytics_summary.
+    """
+    st.markdown("### 📈 Summary Statistics")
+    
+    display_stat_cards([
+        ("#d4af37", summary['total_page_views'], "Total Page Views"),
+        ("#5ba3d0", summary['unique_sessions'], "Unique Visitors"),
+        ("#50c878", summary['pages_tracked'], "Pages Tracked"),
+        ("#e67e22", summary['avg_pages_per_session'], "Avg Pages/Visit"),
+    ], SUMMARY_CARD_BACKGROUND)
+
+
+def display_page_views_table(sorted_pages: list[tuple[str, int]], total_views: int):
     """
+    Display table of page views.
     
-    table_html += '<div class="analytics-table-container"><table class="analytics-table"><thead><tr>'
-    table_html += '<th>Rank</th><th>Page</th><th>Views</th><th>Percentage</th>'
-    table_html += '</tr></thead><tbody>'
+    Args:
+        sorted_pages: (page, views) pairs sorted by views, descending.
+        total_views: Views across all pages, for the percentage column.
+    """
+    st.markdown("### 📑 Page Views Breakdown")
     
-    total_views = sum(page_views.values())
+    if not sorted_pages:
+        st.info("No page view data available yet. Start browsing the site to collect data!")
+        return
     
-    for rank, (page, views) in enumerate(sorted_pages, 1):
-        percentage = (views / total_views * 100) if total_views > 0 else 0
-        table_html += '<tr>'
-        table_html += f'<td><span class="rank-badge">#{rank}</span></td>'
-        table_html += f'<td>{page}</td>'
-        table_html += f'<td>{views}</td>'
-        table_html += f'<td>{percentage:.1f}%</td>'
-        table_html += '</tr>'
+    # Imported here so the password prompt doesn't pay for loading it
+    import pandas as pd
     
-    table_html += '</tbody></table></div>'
+    df = pd.DataFrame(sorted_pages, columns=["Page", "Views"])
+    df.insert(0, "Rank", range(1, len(df) + 1))
+    df["Percentage"] = df["Views"] / total_views * 100 if total_views > 0 else 0.0
     
-    st.components.v1.html(table_html, height=min(600, len(sorted_pages) * 50 + 100), scrolling=True)
+    # Native grid: sorting and scrolling happen in the browser
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Rank": st.column_config.NumberColumn(format="#%d"),
+            "Percentage": st.column_config.ProgressColumn(format="%.1f%%", min_value=0, max_value=100),
+        }
+    )
 
 
 def display_reset_button():
@@ -307,25 +229,35 @@ def display_reset_button():
         if st.button("🔄 Reset Page Analytics", type="secondary", use_container_width=True):
             reset_analytics()
             st.success("Page analytics data has been reset!")
-            st.rerun()
+            st.rerun(scope="fragment")
     
     with col2:
         if st.button("🔄 Reset Widget Analytics", type="secondary", use_container_width=True):
+            # Imported here so the analytics backend only loads when it is needed
+            import streamlit_analytics2 as streamlit_analytics
             streamlit_analytics.reset_counts()
             st.success("Widget analytics data has been reset!")
-            st.rerun()
+            st.rerun(scope="fragment")
 
 
-def display_hourly_activity_chart():
-    """Display chart showing activity by hour of day."""
+def display_hourly_activity_chart(hourly_data: dict[int, int]):
+    """
+    Display chart showing activity by hour of day.
+    
+    Args:
+        hourly_data: Page views per hour (0-23).
+    """
     st.markdown("### ⏰ Activity by Hour of Day")
     
-    hourly_data = get_hourly_activity()
     
     if not hourly_data or sum(hourly_data.values()) == 0:
         st.info("No hourly activity data available yet.")
         return
     
+    # Imported here so the password prompt doesn't pay for loading them
+    import pandas as pd
+    import plotly.express as px
+    
     # Create DataFrame
     df = pd.DataFrame([
         {"Hour": f"{hour:02d}:00", "Views": count}
@@ -353,16 +285,24 @@ def display_hourly_activity_chart():
     st.plotly_chart(fig, use_container_width=True)
 
 
-def display_daily_activity_chart():
-    """Display chart showing activity by day of week."""
+def display_daily_activity_chart(daily_data: dict[str, int]):
+    """
+    Display chart showing activity by day of week.
+    
+    Args:
+        daily_data: Page views per day name (Monday-Sunday).
+    """
     st.markdown("### 📅 Activity by Day of Week")
     
-    daily_data = get_daily_activity()
     
     if not daily_data or sum(daily_data.values()) == 0:
         st.info("No daily activity data available yet.")
         return
     
+    # Imported here so the password prompt doesn't pay for loading them
+    import pandas as pd
+    import plotly.express as px
+    
     # Create DataFrame (preserve order)
     days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     df = pd.DataFrame([
@@ -391,16 +331,24 @@ def display_daily_activity_chart():
     st.plotly_chart(fig, use_container_width=True)
 
 
-def display_date_activity_chart():
-    """Display chart showing activity over time (by date)."""
+def display_date_activity_chart(date_data: dict[str, int]):
+    """
+    Display chart showing activity over time (by date).
+    
+    Args:
+        date_data: Page views per date (YYYY-MM-DD).
+    """
     st.markdown("### 📈 Activity Over Time")
     
-    date_data = get_activity_by_date()
     
     if not date_data or sum(date_data.values()) == 0:
         st.info("No date activity data available yet.")
         return
     
+    # Imported here so the password prompt doesn't pay for loading them
+    import pandas as pd
+    import plotly.express as px
+    
     # Create DataFrame
     df = pd.DataFrame([
         {"Date": date, "Views": count}
@@ -432,128 +380,78 @@ def display_date_activity_chart():
     st.plotly_chart(fig, use_container_width=True)
 
 
-def display_page_popularity_chart():
-    """Display bar chart of page popularity."""
-    st.markdown("### 📊 Page Popularity")
+def display_page_popularity_chart(sorted_pages: list[tuple[str, int]]):
+    """
+    Display bar chart of page popularity.
     
-    # Get our custom analytics data
-    page_views = get_page_views()
+    Args:
+        sorted_pages: (page, views) pairs sorted by views, descending.
+    """
+    st.markdown("### 📊 Page Popularity")
     
-    if not page_views:
+    if not sorted_pages:
         st.info("No page view data available yet.")
         return
     
-    # Sort by views
-    sorted_pages = sorted(page_views.items(), key=lambda x: x[1], reverse=True)[:10]
-    
-    # Create bar chart data
+    # Create bar chart data for the top 10 pages
     import pandas as pd
-    df = pd.DataFrame(sorted_pages, columns=["Page", "Views"])
+    df = pd.DataFrame(sorted_pages[:10], columns=["Page", "Views"])
     
     st.bar_chart(df.set_index("Page"))
 
 
-def display_session_statistics():
-    """Display session-related statistics."""
+def display_session_statistics(summary: dict):
+    """
+    Display session-related statistics.
+    
+    Args:
+        summary: Analytics summary from load_analytics_summary.
+    """
     st.markdown("### ⏱️ Session Statistics")
     
-    # Get our custom analytics data
-    summary = get_analytics_summary()
     total_page_views = summary['total_page_views']
     unique_sessions = summary['unique_sessions']
     avg_pages = summary['avg_pages_per_session']
     
-    col1, col2, col3 = st.columns(3)
-        
-    with col1:
-        st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, rgba(30,30,30,0.95), rgba(40,40,40,0.95));
-                border: 2px solid #d4af37;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            '>
-                <div style='color: #d4af37; font-size: 2.5rem; font-weight: bold;'>
-                    {unique_sessions}
-                </div>
-                <div style='color: #888; font-size: 0.9rem; margin-top: 0.5rem;'>
-                    Unique Sessions
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, rgba(30,30,30,0.95), rgba(40,40,40,0.95));
-                border: 2px solid #5ba3d0;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            '>
-                <div style='color: #5ba3d0; font-size: 2.5rem; font-weight: bold;'>
-                    {total_page_views}
-                </div>
-                <div style='color: #888; font-size: 0.9rem; margin-top: 0.5rem;'>
-                    Total Page Views
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-            <div style='
-                background: linear-gradient(135deg, rgba(30,30,30,0.95), rgba(40,40,40,0.95));
-                border: 2px solid #50c878;
-                border-radius: 8px;
-                padding: 1.5rem;
-                text-align: center;
-            '>
-                <div style='color: #50c878; font-size: 2.5rem; font-weight: bold;'>
-                    {avg_pages}
-                </div>
-                <div style='color: #888; font-size: 0.9rem; margin-top: 0.5rem;'>
-                    Avg Pages/Session
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-
+    display_stat_cards([
+        ("#d4af37", unique_sessions, "Unique Sessions"),
+        ("#5ba3d0", total_page_views, "Total Page Views"),
+        ("#50c878", avg_pages, "Avg Pages/Session"),
+    ], SESSION_CARD_BACKGROUND)
 
-def main() -> None:
-    """Main function to render the analytics dashboard page."""
-    
-    # Check password first
-    if not check_password():
-        st.stop()
-    
-    logger.info("Admin accessed analytics dashboard")
-    
-    # Show sidebar navigation
-    create_sidebar_navigation("Admin Analytics")
 
-    # Page header
-    create_page_header(
-        title="Analytics Dashboard",
-        subtitle="Track website traffic and popular content",
-        icon="📊"
-    )
+@st.fragment
+def render_dashboard() -> None:
+    """
+    Render the statistics sections and the management buttons.
     
+    Runs as a fragment, so the refresh and reset buttons only rerun the
+    dashboard instead of the whole page (password check, CSS, sidebar).
+    """
     # Add refresh button
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("🔄 Refresh Statistics", use_container_width=True, type="primary"):
-            st.rerun()
+        # The click itself reruns this fragment, which re-reads the statistics
+        st.button("🔄 Refresh Statistics", use_container_width=True, type="primary")
     
     st.markdown("<br>", unsafe_allow_html=True)
     
+    # Aggregate the analytics file once per change, shared by the sections
+    analytics_mtime = ANALYTICS_FILE.stat().st_mtime if ANALYTICS_FILE.exists() else None
+    summary = load_analytics_summary(analytics_mtime)
+    activity = load_activity(analytics_mtime)
+    
+    # Top pages by views (descending) for the chart and the table; nlargest
+    # only keeps TOP_PAGES entries on a heap instead of sorting every page
+    sorted_pages = heapq.nlargest(TOP_PAGES, summary['page_views'].items(), key=itemgetter(1))
+    
     # Display summary cards
-    display_analytics_summary()
+    display_analytics_summary(summary)
     
     st.markdown("---")
     
     # Display session statistics
-    display_session_statistics()
+    display_session_statistics(summary)
     
     st.markdown("---")
     
@@ -561,28 +459,51 @@ def main() -> None:
     col1, col2 = st.columns(2)
     
     with col1:
-        display_hourly_activity_chart()
+        display_hourly_activity_chart(activity["hourly"])
     
     with col2:
-        display_daily_activity_chart()
+        display_daily_activity_chart(activity["daily"])
     
     st.markdown("---")
     
     # Display activity over time
-    display_date_activity_chart()
+    display_date_activity_chart(activity["by_date"])
     
     st.markdown("---")
     
     # Display page popularity chart
-    display_page_popularity_chart()
+    display_page_popularity_chart(sorted_pages)
     
     st.markdown("---")
     
     # Display page views table
-    display_page_views_table()
+    display_page_views_table(sorted_pages, summary['total_page_views'])
     
     # Display management buttons
     display_reset_button()
+
+
+def main() -> None:
+    """Main function to render the analytics dashboard page."""
+    
+    # Check password first
+    if not check_password():
+        st.stop()
+    
+    logger.info("Admin accessed analytics dashboard")
+    
+    # Show sidebar navigation
+    create_sidebar_navigation("Admin Analytics")
+
+    # Page header
+    create_page_header(
+        title="Analytics Dashboard",
+        subtitle="Track website traffic and popular content",
+        icon="📊"
+    )
+    
+    # Refresh button, statistics and management buttons
+    render_dashboard()
     
     # Info box
     st.markdown("---")
@@ -6,13 +6,17 @@ Users can view equipment stats, search by name or slot, and see where to obtain
 """
 
 import streamlit as st
-import pandas as pd
-import base64
-import os
+from pathlib import Path
 import uuid
 import streamlit_analytics2 as streamlit_analytics
 
-from src.services.equipment_service import load_equipment, search_equipment, get_equipment_slots
+from src.config import EQUIPMENT_FILE, EQUIPMENT_IMAGES_DIR, EQUIPMENT_IMAGES_URL
+from src.services.equipment_service import (
+    load_equipment,
+    load_equipment_by_slot,
+    search_equipment,
+    get_equipment_slots
+)
 from src.ui.layout import (
     setup_page_config,
     load_custom_css,
@@ -27,159 +31,229 @@ from src.analytics_utils import track_page_view
 logger = setup_logger(__name__)
 
 
-def get_image_as_base64(image_path: str) -> str:
-    """Convert an image file to base64 string."""
-    try:
-        if os.path.exists(image_path):
-            with open(image_path, "rb") as f:
-                data = f.read()
-                encoded = base64.b64encode(data).decode()
-                ext = os.path.splitext(image_path)[1][1:]  # Get extension without dot
-                return f"data:image/{ext};base64,{encoded}"
-    except Exception as e:
-        logger.error(f"Error loading image {image_path}: {e}")
-    return ""
+# Styles for the equipment table and its Sell To tooltips
+EQUIPMENT_TABLE_CSS = """
+<style>
+.equipment-table-container {
+    background-color: #1a1a1a;
+    padding: 20px;
+    border-radius: 4px;
+    margin: 20px 0;
+}
 
-# Initialize session ID for analytics
-if "session_id" not in st.session_state:
-    st.session_state.session_id = str(uuid.uuid4())
+.equipment-table {
+    width: 100%;
+    border-collapse: collapse;
+    background-color: #1a1a1a;
+    font-size: 14px;
+    color: #e0e0e0;
+}
 
-# Start analytics tracking
-streamlit_analytics.start_tracking()
+.equipment-table thead {
+    background-color: #2d2d2d;
+}
 
-# Configure page
-setup_page_config("Equipment", "🛡️")
-load_custom_css()
-create_sidebar_navigation("Equipment")
+.equipment-table thead th {
+    color: #e0e0e0;
+    font-weight: bold;
+    text-align: left;
+    padding: 12px 8px;
+    border-bottom: 2px solid #444;
+    cursor: pointer;
+    user-select: none;
+    position: relative;
+}
 
+.equipment-table thead th:hover {
+    background-color: #3d3d3d;
+}
 
-def main() -> None:
-    """Main function to render the equipment page."""
-    logger.info("Rendering equipment page")
-    
-    # Track page view
-    session_id = st.session_state.get("session_id")
-    track_page_view("Equipment", session_id)
-    
-    # Page header
-    create_page_header(
-        title="Equipment",
-        subtitle="Browse all equipment available on the Fibula server",
-        icon=""
-    )
-    
-    # Search and filter section
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        search_query = st.text_input(
-            "Search equipment",
-            placeholder="Search by name, slot, monster, or NPC...",
-            key="equipment_search"
-        )
-    
-    with col2:
-        # Get filter from navigation or button click
-        default_filter = st.session_state.get("quick_filter_equip", "Helmets")
-        nav_filter = st.session_state.get("equipment_filter", default_filter)
-        selected_slot = st.selectbox(
-            "Filter by slot",
-            options=["Helmets", "Armor", "Legs", "Boots", "Shields", "Amulets & Rings"],
-            index=["Helmets", "Armor", "Legs", "Boots", "Shields", "Amulets & Rings"].index(nav_filter) if nav_filter in ["Helmets", "Armor", "Legs", "Boots", "Shields", "Amulets & Rings"] else 0,
-            key="equipment_slot_filter"
-        )
-        # Clear the session state filter
-        if "equipment_filter" in st.session_state:
-            del st.session_state["equipment_filter"]
-    
-    # Quick filter buttons
-    st.markdown("**Quick Filters:**")
-    col_btn0, col_btn1, col_btn2, col_btn3, col_btn4, col_btn5, col_btn6 = st.columns(7)
-    
-    with col_btn0:
-        if st.button("All Equipment", use_container_width=True, key="btn_all_equip"):
-            st.session_state.quick_filter_equip = None
-            st.rerun()
-    
-    with col_btn1:
-        if st.button("Helmets", use_container_width=True, key="btn_helmets"):
-            st.session_state.quick_filter_equip = "Helmets"
-            st.rerun()
-    
-    with col_btn2:
-        if st.button("Armor", use_container_width=True, key="btn_armor"):
-            st.session_state.quick_filter_equip = "Armor"
-            st.rerun()
-    
-    with col_btn3:
-        if st.button("Legs", use_container_width=True, key="btn_legs"):
-            st.session_state.quick_filter_equip = "Legs"
-            st.rerun()
-    
-    with col_btn4:
-        if st.button("Boots", use_container_width=True, key="btn_boots"):
-            st.session_state.quick_filter_equip = "Boots"
-            st.rerun()
-    
-    with col_btn5:
-        if st.button("Shields", use_container_width=True, key="btn_shields"):
-            st.session_state.quick_filter_equip = "Shields"
-            st.rerun()
+.equipment-table thead th.sortable::after {
+    content: ' ⇅';
+    opacity: 0.5;
+    font-size: 11px;
+    margin-left: 5px;
+}
+
+.equipment-table thead th.sorted-asc::after {
+    content: ' ▲';
+    opacity: 1;
+}
+
+.equipment-table thead th.sorted-desc::after {
+    content: ' ▼';
+    opacity: 1;
+}
+
+.equipment-table tbody tr:nth-child(odd) {
+    background-color: #1a1a1a;
+}
+
+.equipment-table tbody tr:nth-child(even) {
+    background-color: #2a2a2a;
+}
+
+.equipment-table tbody tr:hover {
+    background-color: #353535 !important;
+}
+
+.equipment-table tbody td {
+    padding: 10px 8px;
+    border-bottom: 1px solid #333;
+    color: #e0e0e0;
+}
+
+.equipment-table td.center,
+.equipment-table th.center {
+    text-align: center;
+}
+
+/* Specific column widths */
+.equipment-table th:nth-child(3),
+.equipment-table td:nth-child(3) {
+    width: 80px;
+    max-width: 80px;
+}
+
+.equipment-table-container {
+    display: block;
+    margin: 0 auto;
+    image-rendering: pixelated;
+    image-rendering: -moz-crisp-edges;
+    image-rendering: crisp-edges;
+}
+
+.table-info {
+    color: #e0e0e0;
+    margin-bottom: 10px;
+    font-size: 14px;
+}
+
+/* NPC Tooltip Styles */
+.npc-count {
+    cursor: help;
+    position: relative;
+    display: inline-block;
+    color: #d4af37;
+    font-weight: bold;
+}
+
+.npc-tooltip {
+    visibility: hidden;
+    position: absolute;
+    z-index: 1000;
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    text-align: left;
+    border-radius: 6px;
+    padding: 10px;
+    border: 2px solid #d4af37;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.5);
+    min-width: 200px;
+    bottom: 125%;
+    left: 50%;
+    transform: translateX(-50%);
+    opacity: 0;
+    transition: opacity 0.3s, visibility 0.3s;
+}
+
+.npc-count:hover .npc-tooltip {
+    visibility: visible;
+    opacity: 1;
+}
+
+.npc-tooltip-header {
+    font-weight: bold;
+    color: #d4af37;
+    margin-bottom: 8px;
+    padding-bottom: 5px;
+    border-bottom: 1px solid #444;
+}
+
+.npc-tooltip-item {
+    padding: 3px 0;
+    font-size: 13px;
+}
+</style>
+"""
+
+# Slot filter options, in the order shown on the page
+SLOT_FILTERS = ["All Equipment", "Helmets", "Armor", "Legs", "Boots", "Shields", "Amulets & Rings"]
+
+# Map display names to actual slot names in JSON
+SLOT_MAPPING = {
+    "Helmets": ["helmet"],
+    "Armor": ["armor"],
+    "Legs": ["legs"],
+    "Boots": ["boots"],
+    "Shields": ["shields"],
+    "Amulets & Rings": ["ring", "amulet"]
+}
+
+
+def filter_equipment(search_query: str, selected_slot: str | None) -> list:
+    """
+    Load equipment matching the search query and slot filter.
     
-    with col_btn6:
-        if st.button("Amulets & Rings", use_container_width=True, key="btn_amulets"):
-            st.session_state.quick_filter_equip = "Amulets & Rings"
-            st.rerun()
+    Args:
+        search_query: Text from the search box (empty for no search).
+        selected_slot: Display name of the slot filter, or None for all.
     
-    # Use the filter from quick buttons if it was just set
-    if "quick_filter_equip" in st.session_state:
-        selected_slot = st.session_state.quick_filter_equip
+    Returns:
+        List of matching EquipmentItem objects.
+    """
+    # Slot filter (None/All Equipment means no filter)
+    target_slots = SLOT_MAPPING.get(selected_slot, [selected_slot.lower()]) if selected_slot else None
     
-    # Load and filter equipment
     if search_query:
         equipment = search_equipment(search_query)
+        if target_slots:
+            equipment = [e for e in equipment if e.slot.lower() in target_slots]
+    elif target_slots:
+        # Slot groups come straight from the cached slot index
+        by_slot = load_equipment_by_slot()
+        equipment = [e for slot in target_slots for e in by_slot.get(slot, [])]
     else:
         equipment = load_equipment()
     
-    # Apply slot filter (only if not None/All Equipment)
-    if selected_slot:
-        # Map display names to actual slot names in JSON
-        slot_mapping = {
-            "Helmets": "helmet",
-            "Armor": "armor",
-            "Legs": "legs",
-            "Boots": "boots",
-            "Shields": "shields",
-            "Amulets & Rings": ["amulet", "ring"]
-        }
-        
-        target_slots = slot_mapping.get(selected_slot, selected_slot.lower())
-        
-        if isinstance(target_slots, list):
-            equipment = [e for e in equipment if e.slot.lower() in target_slots]
-        else:
-            equipment = [e for e in equipment if e.slot.lower() == target_slots]
+    return equipment
+
+
+@st.cache_data(show_spinner=False)
+def render_equipment_table(mtime: float | None, search_query: str, selected_slot: str | None) -> tuple[str, int]:
+    """
+    Render the equipment table HTML for a search query and slot filter.
     
-    # Determine if we're showing rings/amulets (properties) or defense equipment
-    is_accessories = selected_slot == "Amulets & Rings"
+    Cached per equipment.json modification time, query and slot, so a rerun
+    (or returning to a filter already shown) reuses the rendered rows
+    instead of filtering and rebuilding them.
+    
+    Args:
+        mtime: Modification time of equipment.json, or None if it doesn't
+            exist (cache key only).
+        search_query: Text from the search box (empty for no search).
+        selected_slot: Display name of the slot filter, or None for all.
     
+    Returns:
+        Tuple of the table HTML (including the result count) and the number
+        of matching items.
+    """
+    equipment = filter_equipment(search_query, selected_slot)
     if not equipment:
-        st.info("No equipment found matching your criteria.")
-        create_footer()
-        return
+        return "", 0
     
-    # Convert to DataFrame for display
+    # Determine if we're showing rings/amulets (properties) or defense equipment
+    is_accessories = selected_slot == "Amulets & Rings"
+    
+    # Collect the table rows
     equipment_data = []
     for item in equipment:
-        # Build image path from equipment data
-        image_base64 = ""
+        # Build image URL from equipment data (icons are served from static/)
+        image_url = ""
         if hasattr(item, 'image') and item.image:
-            # Convert relative path to absolute
-            full_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                item.image.replace("./", "")
-            )
-            image_base64 = get_image_as_base64(full_path)
+            image_name = Path(item.image).name
+            if (EQUIPMENT_IMAGES_DIR / image_name).exists():
+                image_url = f"{EQUIPMENT_IMAGES_URL}/{image_name}"
         
         # Handle sell_to - build tooltip data using NPCPrice objects
         sell_to_count = len(item.sell_to) if item.sell_to else 0
@@ -224,7 +298,7 @@ def main() -> None:
         
         # Build data row - include both defense and properties
         row_data = {
-            "image_base64": image_base64,
+            "image_url": image_url,
             "Name": item.name,
             "Slot": item.slot.capitalize(),
             "Def": item.defense,
@@ -238,213 +312,136 @@ def main() -> None:
         
         equipment_data.append(row_data)
     
-    df = pd.DataFrame(equipment_data)
-    
-    # Custom CSS for table styling
-    st.markdown("""
-        <style>
-        .equipment-table-container {
-            background-color: #1a1a1a;
-            padding: 20px;
-            border-radius: 4px;
-            margin: 20px 0;
-        }
-        
-        .equipment-table {
-            width: 100%;
-            border-collapse: collapse;
-            background-color: #1a1a1a;
-            font-size: 14px;
-            color: #e0e0e0;
-        }
-        
-        .equipment-table thead {
-            background-color: #2d2d2d;
-        }
-        
-        .equipment-table thead th {
-            color: #e0e0e0;
-            font-weight: bold;
-            text-align: left;
-            padding: 12px 8px;
-            border-bottom: 2px solid #444;
-            cursor: pointer;
-            user-select: none;
-            position: relative;
-        }
-        
-        .equipment-table thead th:hover {
-            background-color: #3d3d3d;
-        }
-        
-        .equipment-table thead th.sortable::after {
-            content: ' ⇅';
-            opacity: 0.5;
-            font-size: 11px;
-            margin-left: 5px;
-        }
-        
-        .equipment-table thead th.sorted-asc::after {
-            content: ' ▲';
-            opacity: 1;
-        }
-        
-        .equipment-table thead th.sorted-desc::after {
-            content: ' ▼';
-            opacity: 1;
-        }
-        
-        .equipment-table tbody tr:nth-child(odd) {
-            background-color: #1a1a1a;
-        }
-        
-        .equipment-table tbody tr:nth-child(even) {
-            background-color: #2a2a2a;
-        }
-        
-        .equipment-table tbody tr:hover {
-            background-color: #353535 !important;
-        }
-        
-        .equipment-table tbody td {
-            padding: 10px 8px;
-            border-bottom: 1px solid #333;
-            color: #e0e0e0;
-        }
-        
-        .equipment-table td.center,
-        .equipment-table th.center {
-            text-align: center;
-        }
-        
-        /* Specific column widths */
-        .equipment-table th:nth-child(3),
-        .equipment-table td:nth-child(3) {
-            width: 80px;
-            max-width: 80px;
-        }
-        
-        .equipment-table-container {
-            display: block;
-            margin: 0 auto;
-            image-rendering: pixelated;
-            image-rendering: -moz-crisp-edges;
-            image-rendering: crisp-edges;
-        }
-        
-        .table-info {
-            color: #e0e0e0;
-            margin-bottom: 10px;
-            font-size: 14px;
-        }
-        
-        /* NPC Tooltip Styles */
-        .npc-count {
-            cursor: help;
-            position: relative;
-            display: inline-block;
-            color: #d4af37;
-            font-weight: bold;
-        }
-        
-        .npc-tooltip {
-            visibility: hidden;
-            position: absolute;
-            z-index: 1000;
-            background-color: #2d2d2d;
-            color: #e0e0e0;
-            text-align: left;
-            border-radius: 6px;
-            padding: 10px;
-            border: 2px solid #d4af37;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.5);
-            min-width: 200px;
-            bottom: 125%;
-            left: 50%;
-            transform: translateX(-50%);
-            opacity: 0;
-            transition: opacity 0.3s, visibility 0.3s;
-        }
-        
-        .npc-count:hover .npc-tooltip {
-            visibility: visible;
-            opacity: 1;
-        }
-        
-        .npc-tooltip-header {
-            font-weight: bold;
-            color: #d4af37;
-            margin-bottom: 8px;
-            padding-bottom: 5px;
-            border-bottom: 1px solid #444;
-        }
-        
-        .npc-tooltip-item {
-            padding: 3px 0;
-            font-size: 13px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
-    # Build HTML table
-    table_html = '<div class="equipment-table-container">'
-    table_html += f'<div class="table-info">Found {len(equipment)} equipment item(s)</div>'
-    table_html += '<table class="equipment-table" id="equipmentTable"><thead><tr>'
-    table_html += '<th class="center sortable" data-column="0">Image</th>'
-    table_html += '<th class="sortable" data-column="1">Name</th>'
-    table_html += '<th class="center sortable" data-column="2">Slot</th>'
+    # Build HTML table from a list of parts, joined once
+    parts = [
+        '<div class="equipment-table-container">',
+        f'<div class="table-info">Found {len(equipment)} equipment item(s)</div>',
+        '<table class="equipment-table" id="equipmentTable"><thead><tr>',
+        '<th class="center sortable" data-column="0">Image</th>',
+        '<th class="sortable" data-column="1">Name</th>',
+        '<th class="center sortable" data-column="2">Slot</th>',
+    ]
     
     # Dynamic column: Armor or Effect
     if is_accessories:
-        table_html += '<th class="sortable" data-column="3">Effect</th>'
+        parts.append('<th class="sortable" data-column="3">Effect</th>')
     else:
-        table_html += '<th class="center sortable" data-column="3">Armor</th>'
+        parts.append('<th class="center sortable" data-column="3">Armor</th>')
     
-    table_html += '<th class="center sortable" data-column="4">Weight (oz.)</th>'
-    table_html += '<th class="center sortable" data-column="5">Sell To</th>'
-    table_html += '<th class="sortable" data-column="6">Looted from</th>'
-    table_html += '<th class="sortable" data-column="7">Reward from</th>'
-    table_html += '</tr></thead><tbody>'
+    parts.append(
+        '<th class="center sortable" data-column="4">Weight (oz.)</th>'
+        '<th class="center sortable" data-column="5">Sell To</th>'
+        '<th class="sortable" data-column="6">Looted from</th>'
+        '<th class="sortable" data-column="7">Reward from</th>'
+        '</tr></thead><tbody>'
+    )
     
-    for _, row in df.iterrows():
-        table_html += '<tr>'
+    for row in equipment_data:
+        parts.append('<tr>')
         # Image column
-        if row["image_base64"]:
-            table_html += f'<td class="center"><img src="{row["image_base64"]}" width="32" height="32" /></td>'
+        if row["image_url"]:
+            parts.append(f'<td class="center"><img src="{row["image_url"]}" width="32" height="32" loading="lazy" decoding="async" /></td>')
         else:
-            table_html += '<td class="center">-</td>'
+            parts.append('<td class="center">-</td>')
         # Other columns
-        table_html += f'<td>{row["Name"]}</td>'
-        table_html += f'<td class="center">{row["Slot"]}</td>'
+        parts.append(f'<td>{row["Name"]}</td>')
+        parts.append(f'<td class="center">{row["Slot"]}</td>')
         
         # Dynamic column content
         if is_accessories:
-            table_html += f'<td>{row["Properties"]}</td>'
+            parts.append(f'<td>{row["Properties"]}</td>')
         else:
-            table_html += f'<td class="center">{row["Def"]}</td>'
+            parts.append(f'<td class="center">{row["Def"]}</td>')
         
-        table_html += f'<td class="center">{row["Weight"]}</td>'
+        parts.append(f'<td class="center">{row["Weight"]}</td>')
         
         # Sell To column with tooltip
         if row["Sell To"] > 0:
-            tooltip_lines = row["sell_to_tooltip"].split("||")
-            tooltip_html = '<div class="npc-tooltip">'
-            for i, line in enumerate(tooltip_lines):
+            tooltip_parts = ['<div class="npc-tooltip">']
+            for line in row["sell_to_tooltip"].split("||"):
                 if line:
                     if "Sell To" in line:
-                        tooltip_html += f'<div class="npc-tooltip-header">{line}</div>'
+                        tooltip_parts.append(f'<div class="npc-tooltip-header">{line}</div>')
                     else:
-                        tooltip_html += f'<div class="npc-tooltip-item">{line}</div>'
-            tooltip_html += '</div>'
-            table_html += f'<td class="center"><span class="npc-count">💰 {row["Sell To"]} NPCs{tooltip_html}</span></td>'
+                        tooltip_parts.append(f'<div class="npc-tooltip-item">{line}</div>')
+            tooltip_parts.append('</div>')
+            tooltip_html = "".join(tooltip_parts)
+            parts.append(f'<td class="center"><span class="npc-count">💰 {row["Sell To"]} NPCs{tooltip_html}</span></td>')
         else:
-            table_html += '<td class="center">-</td>'
+            parts.append('<td class="center">-</td>')
         
-        table_html += f'<td>{row["Dropped by"]}</td>'
-        table_html += f'<td>{row["Reward from"]}</td>'
-        table_html += '</tr>'
+        parts.append(f'<td>{row["Dropped by"]}</td>')
+        parts.append(f'<td>{row["Reward from"]}</td>')
+        parts.append('</tr>')
+    
+    parts.append('</tbody></table></div>')
+    table_html = "".join(parts)
+    
+    return table_html, len(equipment)
+
+
+# Initialize session ID for analytics
+if "session_id" not in st.session_state:
+    st.session_state.session_id = str(uuid.uuid4())
+
+# Start analytics tracking
+streamlit_analytics.start_tracking()
+
+# Configure page
+setup_page_config("Equipment", "🛡️")
+load_custom_css()
+create_sidebar_navigation("Equipment")
+
+
+def main() -> None:
+    """Main function to render the equipment page."""
+    logger.info("Rendering equipment page")
+    
+    # Track page view
+    session_id = st.session_state.get("session_id")
+    track_page_view("Equipment", session_id)
+    
+    # Page header
+    create_page_header(
+        title="Equipment",
+        subtitle="Browse all equipment available on the Fibula server",
+        icon=""
+    )
+    
+    # Search section
+    search_query = st.text_input(
+        "Search equipment",
+        placeholder="Search by name, slot, monster, or NPC...",
+        key="equipment_search"
+    )
+    
+    # Slot filter: a slot chosen from the sidebar preselects its segment
+    nav_filter = st.session_state.pop("equipment_filter", None)
+    if nav_filter is not None:
+        st.session_state.quick_filter_equip = nav_filter if nav_filter in SLOT_FILTERS else "All Equipment"
+    elif "quick_filter_equip" not in st.session_state:
+        st.session_state.quick_filter_equip = "Helmets"
+    
+    choice = st.segmented_control(
+        "Quick Filters",
+        options=SLOT_FILTERS,
+        key="quick_filter_equip"
+    )
     
-    table_html += '</tbody></table></div>'
+    # Deselecting the active segment shows all equipment as well
+    selected_slot = choice if choice in SLOT_MAPPING else None
+    
+    # Load and filter equipment
+    equipment_mtime = EQUIPMENT_FILE.stat().st_mtime if EQUIPMENT_FILE.exists() else None
+    table_html, item_count = render_equipment_table(equipment_mtime, search_query, selected_slot)
+    
+    if not item_count:
+        st.info("No equipment found matching your criteria.")
+        create_footer()
+        return
+    
+    # Custom CSS for table styling
+    st.markdown(EQUIPMENT_TABLE_CSS, unsafe_allow_html=True)
     
     st.markdown(table_html, unsafe_allow_html=True)
     
@@ -467,32 +464,31 @@ def main() -> None:
                 
                 header.addEventListener('click', function() {
                     const columnIndex = parseInt(this.getAttribute('data-column'));
+                    const ascending = sortDirections[columnIndex];
                     const tbody = table.querySelector('tbody');
-                    const rows = Array.from(tbody.querySelectorAll('tr'));
                     
-                    // Sort rows
-                    rows.sort((a, b) => {
-                        let aValue = a.cells[columnIndex].textContent.trim();
-                        let bValue = b.cells[columnIndex].textContent.trim();
-                        
+                    // Read each row's sort key once, instead of re-reading and
+                    // re-parsing both cells in every comparison
+                    const keyed = Array.from(tbody.rows, row => {
+                        const text = row.cells[columnIndex].textContent.trim();
                         // Try to parse as numbers
-                        const aNum = parseFloat(aValue.replace(/[^0-9.-]/g, ''));
-                        const bNum = parseFloat(bValue.replace(/[^0-9.-]/g, ''));
-                        
-                        if (!isNaN(aNum) && !isNaN(bNum)) {
-                            return sortDirections[columnIndex] ? aNum - bNum : bNum - aNum;
+                        const num = parseFloat(text.replace(/[^0-9.-]/g, ''));
+                        return { row, text, num };
+                    });
+                    
+                    // Sort rows
+                    keyed.sort((a, b) => {
+                        if (!isNaN(a.num) && !isNaN(b.num)) {
+                            return ascending ? a.num - b.num : b.num - a.num;
                         }
                         
                         // String comparison
-                        const comparison = aValue.localeCompare(bValue);
-                        return sortDirections[columnIndex] ? comparison : -comparison;
+                        const comparison = a.text.localeCompare(b.text);
+                        return ascending ? comparison : -comparison;
                     });
                     
-                    // Clear tbody
-                    tbody.innerHTML = '';
-                    
-                    // Add sorted rows
-                    rows.forEach(row => tbody.appendChild(row));
+                    // Move the rows into sorted order with a single DOM call
+                    tbody.append(...keyed.map(k => k.row));
                     
                     // Update sort indicators
                     headers.forEach(h => h.classList.remove('sorted-asc', 'sorted-desc'));
@@ -28,11 +28,9 @@ def get_image_as_base64(image_path: Path) -> str:
     """Convert an image file to base64 string."""
     try:
         if image_path.exists():
-            with open(image_path, "rb") as f:
-                data = f.read()
-                encoded = base64.b64encode(data).decode()
-                ext = image_path.suffix[1:]  # Get extension without dot
-                return f"data:image/{ext};base64,{encoded}"
+            encoded = base64.b64encode(image_path.read_bytes()).decode()
+            ext = image_path.suffix[1:]  # Get extension without dot
+            return f"data:image/{ext};base64,{encoded}"
     except Exception as e:
         logger.error(f"Error loading image {image_path}: {e}")
     return ""
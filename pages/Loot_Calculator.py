@@ -9,6 +9,7 @@ import streamlit as st
 from typing import List, Dict, Optional
 import base64
 import os
+from pathlib import Path
 import uuid
 import streamlit_analytics2 as streamlit_analytics
 
@@ -43,11 +44,9 @@ def get_image_as_base64(image_path: str) -> str:
     """Convert an image file to base64 string."""
     try:
         if os.path.exists(image_path):
-            with open(image_path, "rb") as f:
-                data = f.read()
-                encoded = base64.b64encode(data).decode()
-                ext = os.path.splitext(image_path)[1][1:]
-                return f"data:image/{ext};base64,{encoded}"
+            encoded = base64.b64encode(Path(image_path).read_bytes()).decode()
+            ext = os.path.splitext(image_path)[1][1:]
+            return f"data:image/{ext};base64,{encoded}"
     except Exception as e:
         logger.error(f"Error loading image {image_path}: {e}")
     return ""
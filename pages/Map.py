@@ -29,9 +29,7 @@ create_sidebar_navigation("Map")
 def get_image_base64(image_path: Path) -> str:
     """Convert image to base64 for embedding."""
     try:
-        with open(image_path, "rb") as f:
-            data = f.read()
-            return base64.b64encode(data).decode()
+        return base64.b64encode(image_path.read_bytes()).decode()
     except Exception as e:
         logger.error(f"Error loading image {image_path}: {e}")
         return ""
@@ -37,9 +37,7 @@ logger = setup_logger(__name__)
 def get_image_base64(image_path: str) -> str:
     """Convert image to base64 for embedding in HTML."""
     try:
-        with open(image_path, "rb") as f:
-            data = f.read()
-            return base64.b64encode(data).decode()
+        return base64.b64encode(Path(image_path).read_bytes()).decode()
     except Exception as e:
         logger.error(f"Error loading image {image_path}: {e}")
         return ""
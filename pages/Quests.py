@@ -44,10 +44,8 @@ def get_spoiler_icon_base64():
     """Get spoiler icon as base64 for embedding in HTML."""
     icon_path = ASSETS_DIR / "items" / "Parchment_of_Interest.gif"
     try:
-        with open(icon_path, "rb") as f:
-            data = f.read()
-            encoded = base64.b64encode(data).decode()
-            return f"data:image/gif;base64,{encoded}"
+        encoded = base64.b64encode(icon_path.read_bytes()).decode()
+        return f"data:image/gif;base64,{encoded}"
     except Exception as e:
         logger.error(f"Error loading spoiler icon: {e}")
         return ""
@@ -4,12 +4,13 @@ Analytics utilities for Fibulopedia.
 Simple page view tracking system that works alongside streamlit-analytics2.
 """
 
-import json
+import orjson
 import os
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 from collections import Counter
+from operator import itemgetter
 import threading
 
 # Thread lock for safe file writing
@@ -94,13 +95,15 @@ def get_analytics_summary() -> Dict[str, Any]:
     total_pages_visited = sum(len(s.get("pages_visited", [])) for s in sessions.values())
     avg_pages_per_session = total_pages_visited / len(sessions) if sessions else 0
     
+    most_popular_page = max(page_views.items(), key=itemgetter(1), default=("N/A", 0))
+    
     return {
         "total_page_views": sum(page_views.values()),
         "unique_sessions": len(sessions),
         "pages_tracked": len(page_views),
         "avg_pages_per_session": round(avg_pages_per_session, 2),
         "page_views": page_views,
-        "most_popular_page": max(page_views.items(), key=lambda x: x[1]) if page_views else ("N/A", 0)
+        "most_popular_page": most_popular_page
     }
 
 
@@ -182,8 +185,7 @@ def _load_analytics_data() -> Dict[str, Any]:
         }
     
     try:
-        with open(ANALYTICS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return orjson.loads(ANALYTICS_FILE.read_bytes())
     except Exception:
         return {
             "page_views": {},
@@ -195,7 +197,6 @@ def _load_analytics_data() -> Dict[str, Any]:
 def _save_analytics_data(data: Dict[str, Any]) -> None:
     """Save analytics data to file."""
     try:
-        with open(ANALYTICS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        ANALYTICS_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     except Exception as e:
         print(f"Error saving analytics data: {e}")
@@ -14,6 +14,8 @@ from typing import Final
 PROJECT_ROOT: Final[Path] = Path(__file__).parent.parent
 CONTENT_DIR: Final[Path] = PROJECT_ROOT / "content"
 ASSETS_DIR: Final[Path] = PROJECT_ROOT / "assets"
+STATIC_DIR: Final[Path] = PROJECT_ROOT / "static"  # served by Streamlit at STATIC_URL
+STATIC_URL: Final[str] = "app/static"
 
 # Content file paths
 WEAPONS_FILE: Final[Path] = CONTENT_DIR / "weapons.json"
@@ -23,9 +25,13 @@ MONSTERS_FILE: Final[Path] = CONTENT_DIR / "monsters.json"
 QUESTS_FILE: Final[Path] = CONTENT_DIR / "quests.json"
 SERVER_INFO_FILE: Final[Path] = CONTENT_DIR / "server_info.json"
 LANGUAGES_FILE: Final[Path] = CONTENT_DIR / "languages.json"
+NEWS_FILE: Final[Path] = CONTENT_DIR / "news.json"
 
 # Asset paths
-LOGO_PATH: Final[Path] = ASSETS_DIR / "logo_fibulopedia.png"
+LOGO_PATH: Final[Path] = STATIC_DIR / "logo_fibulopedia.png"
+LOGO_URL: Final[str] = f"{STATIC_URL}/logo_fibulopedia.png"
+EQUIPMENT_IMAGES_DIR: Final[Path] = STATIC_DIR / "equipment"
+EQUIPMENT_IMAGES_URL: Final[str] = f"{STATIC_URL}/equipment"
 MAP_PATH: Final[Path] = ASSETS_DIR / "map_7.1.png"
 STYLES_PATH: Final[Path] = ASSETS_DIR / "styles.css"
 
@@ -25,11 +25,19 @@ from src.logging_utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# Longest query that is searched within its prefix's cached results; longer
+# (typically pasted) queries scan all equipment to keep the recursion shallow
+MAX_INCREMENTAL_QUERY_LENGTH = 32
+
 
 def load_equipment() -> list[EquipmentItem]:
     """
     Load all equipment from the equipment.json file.
     
+    The parsed list is cached per modification time of equipment.json, so
+    page reruns (filter clicks, searches) don't re-read and re-validate the
+    file until it actually changes.
+    
     Returns:
         List of EquipmentItem objects, or an empty list if loading fails.
     
@@ -37,6 +45,60 @@ def load_equipment() -> list[EquipmentItem]:
         >>> equipment = load_equipment()
         >>> print(f"Loaded {len(equipment)} equipment items")
     """
+    return _parse_equipment(_equipment_mtime())
+
+
+def load_equipment_by_slot() -> dict[str, list[EquipmentItem]]:
+    """
+    Load all equipment grouped by slot.
+    
+    The index is built once per modification time of equipment.json, so
+    filtering by slot is a dict lookup instead of a scan over every item.
+    
+    Returns:
+        Dict mapping lowercase slot names to their equipment, in file order.
+    
+    Example:
+        >>> rings = load_equipment_by_slot().get("ring", [])
+    """
+    return _index_equipment_by_slot(_equipment_mtime())
+
+
+def _equipment_mtime() -> float | None:
+    """Return equipment.json's modification time, or None if it doesn't exist."""
+    return EQUIPMENT_FILE.stat().st_mtime if EQUIPMENT_FILE.exists() else None
+
+
+@st.cache_data(show_spinner=False)
+def _index_equipment_by_slot(mtime: float | None) -> dict[str, list[EquipmentItem]]:
+    """
+    Group the parsed equipment by lowercase slot name.
+    
+    Args:
+        mtime: Modification time of equipment.json, or None if it doesn't
+            exist (cache key only).
+    
+    Returns:
+        Dict mapping lowercase slot names to their equipment, in file order.
+    """
+    by_slot: dict[str, list[EquipmentItem]] = {}
+    for item in _parse_equipment(mtime):
+        by_slot.setdefault(item.slot.lower(), []).append(item)
+    return by_slot
+
+
+@st.cache_data(show_spinner=False)
+def _parse_equipment(mtime: float | None) -> list[EquipmentItem]:
+    """
+    Read and parse equipment.json.
+    
+    Args:
+        mtime: Modification time of equipment.json, or None if it doesn't
+            exist (cache key only).
+    
+    Returns:
+        List of EquipmentItem objects, or an empty list if loading fails.
+    """
     data = load_json(EQUIPMENT_FILE)
     
     if not data or not isinstance(data, list):
@@ -113,8 +175,7 @@ def filter_equipment_by_slot(slot: str) -> list[EquipmentItem]:
     Example:
         >>> helmets = filter_equipment_by_slot("helmet")
     """
-    equipment = load_equipment()
-    return [e for e in equipment if e.slot.lower() == slot.lower()]
+    return load_equipment_by_slot().get(slot.lower(), [])
 
 
 def search_equipment(query: str) -> list[EquipmentItem]:
@@ -133,8 +194,34 @@ def search_equipment(query: str) -> list[EquipmentItem]:
     if not query:
         return load_equipment()
     
-    equipment = load_equipment()
-    query_lower = query.lower()
+    results = _search_equipment(_equipment_mtime(), query.lower())
+    
+    logger.info(f"Search for '{query}' found {len(results)} equipment items")
+    return results
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _search_equipment(mtime: float | None, query_lower: str) -> list[EquipmentItem]:
+    """
+    Find the equipment matching a lowercase query.
+    
+    Every field matches by substring, so an item matching a query also
+    matches the query minus its last character. Short queries therefore only
+    filter the cached results for that prefix, and typing "drag", "drago",
+    "dragon" re-checks just the previous matches instead of every item.
+    
+    Args:
+        mtime: Modification time of equipment.json, or None if it doesn't
+            exist (cache key only).
+        query_lower: The lowercased search query.
+    
+    Returns:
+        List of equipment matching the query.
+    """
+    if 1 < len(query_lower) <= MAX_INCREMENTAL_QUERY_LENGTH:
+        equipment = _search_equipment(mtime, query_lower[:-1])
+    else:
+        equipment = _parse_equipment(mtime)
     
     results = []
     for item in equipment:
@@ -156,7 +243,6 @@ def search_equipment(query: str) -> list[EquipmentItem]:
                 results.append(item)
                 break
     
-    logger.info(f"Search for '{query}' found {len(results)} equipment items")
     return results
 
 
@@ -46,10 +46,9 @@ def get_image_base64(image_path: str) -> str:
         full_path = base_path / clean_path
         
         if full_path.exists():
-            with open(full_path, "rb") as f:
-                encoded = base64.b64encode(f.read()).decode()
-                ext = full_path.suffix[1:]  # Remove the dot
-                return f"data:image/{ext};base64,{encoded}"
+            encoded = base64.b64encode(full_path.read_bytes()).decode()
+            ext = full_path.suffix[1:]  # Remove the dot
+            return f"data:image/{ext};base64,{encoded}"
     except Exception as e:
         logger.debug(f"Failed to load image {image_path}: {e}")
     
@@ -14,7 +14,9 @@ from src.config import (
     APP_TITLE,
     APP_SUBTITLE,
     ASSETS_DIR,
+    EQUIPMENT_IMAGES_DIR,
     LOGO_PATH,
+    LOGO_URL,
     NAVIGATION_ITEMS,
     STYLES_PATH,
     Theme
@@ -22,12 +24,29 @@ from src.config import (
 
 
 @st.cache_data
-def load_icon_path(icon_name: str) -> str:
+def load_icon_path(icon_name: str, icons_dir: Path = ASSETS_DIR / "items") -> str:
     """Cache icon paths to avoid repeated file system checks."""
-    icon_path = ASSETS_DIR / "items" / icon_name
+    icon_path = icons_dir / icon_name
     return str(icon_path) if icon_path.exists() else None
 
 
+@st.cache_data(show_spinner=False)
+def load_stylesheet(mtime: float) -> str:
+    """
+    Read the custom stylesheet from disk.
+    
+    Cached until the file changes: callers pass the stylesheet's
+    modification time, so an edit to styles.css produces a new cache key.
+    
+    Args:
+        mtime: Modification time of the stylesheet (cache key only).
+    
+    Returns:
+        Contents of the stylesheet.
+    """
+    return STYLES_PATH.read_text(encoding="utf-8")
+
+
 def load_custom_css() -> None:
     """
     Load and apply custom CSS styles from the assets folder.
@@ -40,8 +59,7 @@ def load_custom_css() -> None:
     """
     # Try to load CSS from file
     if STYLES_PATH.exists():
-        with open(STYLES_PATH, "r", encoding="utf-8") as f:
-            css = f.read()
+        css = load_stylesheet(STYLES_PATH.stat().st_mtime)
         st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
     else:
         # Fallback to inline CSS if file doesn\'\'t exist
@@ -234,10 +252,6 @@ def create_sidebar_navigation(current_page: str = "Home") -> None:
     with st.sidebar:
         # Display logo at the top with effects
         if LOGO_PATH.exists():
-            import base64
-            with open(LOGO_PATH, "rb") as f:
-                logo_data = base64.b64encode(f.read()).decode()
-
             st.markdown(f"""
                 <style>
                 .logo-container {{ 
@@ -301,7 +315,7 @@ def create_sidebar_navigation(current_page: str = "Home") -> None:
                 </style>
                 <div class="gold-separator"></div>
                 <div class="logo-container">
-                    <img src="data:image/png;base64,{logo_data}" alt="Fibulopedia Logo">
+                    <img src="{LOGO_URL}" alt="Fibulopedia Logo">
                 </div>
             """, unsafe_allow_html=True)
         
@@ -514,7 +528,7 @@ def create_sidebar_navigation(current_page: str = "Home") -> None:
             st.session_state.show_equipment = current_page == "Equipment"
         
         # Load equipment icon
-        equipment_icon_path = load_icon_path("magic_plate_armor.gif")
+        equipment_icon_path = load_icon_path("magic_plate_armor.gif", EQUIPMENT_IMAGES_DIR)
         if equipment_icon_path:
             col1, col2 = st.columns([1, 5])
             with col1:
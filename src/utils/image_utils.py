@@ -41,8 +41,7 @@ def image_to_base64(image_path: str | Path) -> Optional[str]:
             return None
         
         # Read image bytes
-        with open(img_file, "rb") as f:
-            img_bytes = f.read()
+        img_bytes = img_file.read_bytes()
         
         # Encode to base64
         img_base64 = base64.b64encode(img_bytes).decode("utf-8")
@@ -0,0 +1,116 @@
+"""
+Unit tests for equipment_service module.
+
+Tests that the incremental equipment search returns the same items as a
+plain scan over all equipment, whatever order the queries come in.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.models import EquipmentItem, NPCPrice
+from src.services.equipment_service import (
+    MAX_INCREMENTAL_QUERY_LENGTH,
+    _search_equipment,
+    search_equipment
+)
+
+LONG_DESCRIPTION = (
+    "Forged from the scales of an ancient dragon lord, this shield "
+    "protects its bearer from fire and frost alike."
+)
+
+EQUIPMENT = [
+    EquipmentItem(id="dragon_shield", slot="shield", name="Dragon Shield",
+                  defense=31, weight=60.0, dropped_by=["Dragon", "Dragon Lord"],
+                  sell_to=[NPCPrice(npc="Rashid", price=4000)]),
+    EquipmentItem(id="dragon_scale_mail", slot="armor", name="Dragon Scale Mail",
+                  defense=15, weight=114.0, dropped_by=["Dragon Lord"]),
+    EquipmentItem(id="mastermind_shield", slot="shield", name="Mastermind Shield",
+                  defense=37, weight=57.0, description=LONG_DESCRIPTION),
+    EquipmentItem(id="steel_helmet", slot="helmet", name="Steel Helmet",
+                  defense=6, weight=46.0, sell_to=[NPCPrice(npc="Dragan", price=293)]),
+    EquipmentItem(id="leather_legs", slot="legs", name="Leather Legs",
+                  defense=1, weight=18.0, description="Light legs for a novice."),
+    EquipmentItem(id="ring_of_healing", slot="ring", name="Ring of Healing",
+                  defense=0, weight=0.8, properties="Faster regeneration",
+                  dropped_by=["Scarab"]),
+]
+
+
+def full_scan(query: str) -> list[EquipmentItem]:
+    """Match every item against the query without any caching."""
+    query_lower = query.lower()
+    return [
+        item for item in EQUIPMENT
+        if query_lower in item.name.lower()
+        or query_lower in item.slot.lower()
+        or (item.description and query_lower in item.description.lower())
+        or any(query_lower in monster.lower() for monster in item.dropped_by)
+        or any(query_lower in npc_price.npc.lower() for npc_price in item.sell_to)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def fake_equipment():
+    """Serve EQUIPMENT from a fresh search cache for each test."""
+    _search_equipment.clear()
+    with patch('src.services.equipment_service._parse_equipment', return_value=EQUIPMENT), \
+         patch('src.services.equipment_service._equipment_mtime', return_value=1.0):
+        yield
+    _search_equipment.clear()
+
+
+def ids(items: list[EquipmentItem]) -> list[str]:
+    """Return item ids in order, for readable assertion diffs."""
+    return [item.id for item in items]
+
+
+class TestSearchEquipment:
+    """Tests for search_equipment against a plain full scan."""
+    
+    def test_growing_prefix(self):
+        """Test typing a query one character at a time."""
+        query = "dragon"
+        for end in range(1, len(query) + 1):
+            prefix = query[:end]
+            assert ids(search_equipment(prefix)) == ids(full_scan(prefix))
+    
+    def test_query_not_prefix_of_previous(self):
+        """Test queries that don't extend the previous one."""
+        for query in ["drag", "dragon", "dra", "scale", "steel", "drag", "sc", "dragan"]:
+            assert ids(search_equipment(query)) == ids(full_scan(query))
+    
+    def test_case_folding(self):
+        """Test that queries match regardless of case."""
+        search_equipment("dragon")
+        for query in ["Dragon", "DRAGON", "dRaGoN", "RASHID"]:
+            assert ids(search_equipment(query)) == ids(full_scan(query))
+            assert ids(search_equipment(query)) == ids(search_equipment(query.lower()))
+    
+    def test_empty_query(self):
+        """Test that an empty query returns all equipment."""
+        assert ids(search_equipment("")) == ids(EQUIPMENT)
+        assert ids(_search_equipment(1.0, "")) == ids(EQUIPMENT)
+    
+    def test_single_character_query(self):
+        """Test one-character queries, which scan all equipment."""
+        for query in ["d", "l", "z"]:
+            assert ids(search_equipment(query)) == ids(full_scan(query))
+    
+    def test_query_longer_than_incremental_limit(self):
+        """Test queries past MAX_INCREMENTAL_QUERY_LENGTH."""
+        long_query = LONG_DESCRIPTION[:MAX_INCREMENTAL_QUERY_LENGTH + 8]
+        
+        # Pasted straight in, with no shorter prefix cached
+        assert ids(search_equipment(long_query)) == ids(full_scan(long_query)) == ["mastermind_shield"]
+        
+        # Typed across the limit
+        _search_equipment.clear()
+        for end in range(MAX_INCREMENTAL_QUERY_LENGTH - 2, len(long_query) + 1):
+            prefix = long_query[:end]
+            assert ids(search_equipment(prefix)) == ids(full_scan(prefix))
+        
+        # Long query with no match
+        missing = "x" * (MAX_INCREMENTAL_QUERY_LENGTH + 1)
+        assert search_equipment(missing) == full_scan(missing) == []